@@ -16,12 +16,13 @@ import inspect
 import json
 import warnings
 from abc import ABC
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Hashable
 from queue import Queue
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Literal, Optional, Union
 
 from pydantic import BaseModel
 
+from litserve.batching import AdaptiveBatchTimeout
 from litserve.specs.base import LitSpec
 from litserve.utils import _TimedInitMeta
 
@@ -66,10 +67,12 @@ class LitAPI(ABC, metaclass=_TimedInitMeta):
         decode_request(request): Transform HTTP requests to model input
         encode_response(output): Transform model outputs to HTTP responses
         batch(inputs)/unbatch(outputs): Custom batching logic
+        batch_key(request): Batch only requests of similar shape together
 
     Configuration:
         max_batch_size: Batch multiple requests for better GPU utilization. Defaults to 1.
-        batch_timeout: Wait time for batch to fill (seconds). Defaults to 0.0.
+        batch_timeout: Wait time for batch to fill (seconds), or "auto" to adapt it to the load. Defaults to 0.0.
+        latency_slo: Target request latency (seconds) that bounds the wait when batch_timeout="auto".
         stream: Enable streaming responses for real-time output. Defaults to False.
         api_path: URL endpoint path. Defaults to "/predict".
         enable_async: Enable async/await for non-blocking operations. Defaults to False.
@@ -135,24 +138,33 @@ class LitAPI(ABC, metaclass=_TimedInitMeta):
     _device: Optional[str] = None
     _logger_queue: Optional[Queue] = None
     request_timeout: Optional[float] = None
+    _adaptive_batch_timeout: Optional[AdaptiveBatchTimeout] = None
 
     def __init__(
         self,
         max_batch_size: int = 1,
-        batch_timeout: float = 0.0,
+        batch_timeout: Union[float, Literal["auto"]] = 0.0,
         api_path: str = "/predict",
         stream: bool = False,
         loop: Optional[Union[str, "LitLoop"]] = "auto",
         spec: Optional[LitSpec] = None,
         mcp: Optional["MCP"] = None,
         enable_async: bool = False,
+        latency_slo: Optional[float] = None,
     ):
         """Initialize LitAPI with configuration options."""
 
         if max_batch_size <= 0:
             raise ValueError("max_batch_size must be greater than 0")
 
-        if batch_timeout < 0:
+        if batch_timeout == "auto":
+            if latency_slo is None:
+                raise ValueError("latency_slo is required when batch_timeout='auto'")
+            if latency_slo <= 0:
+                raise ValueError("latency_slo must be greater than 0")
+        elif isinstance(batch_timeout, str):
+            raise ValueError(f"batch_timeout must be a number or 'auto' but got {batch_timeout!r}")
+        elif batch_timeout < 0:
             raise ValueError("batch_timeout must be greater than or equal to 0")
 
         if isinstance(spec, LitSpec):
@@ -186,6 +198,9 @@ class LitAPI(ABC, metaclass=_TimedInitMeta):
         self._spec = spec
         self.max_batch_size = max_batch_size
         self.batch_timeout = batch_timeout
+        self.latency_slo = latency_slo
+        if batch_timeout == "auto":
+            self._adaptive_batch_timeout = AdaptiveBatchTimeout(latency_slo)
         self.enable_async = enable_async
         self._validate_async_methods()
         self.mcp = mcp
@@ -267,6 +282,23 @@ class LitAPI(ABC, metaclass=_TimedInitMeta):
 
         return inputs
 
+    def batch_key(self, x_enc) -> Hashable:
+        """Return the bucket of a request, a batch only holds requests of the same bucket.
+
+        Override this method to batch together inputs of similar shape, e.g. text by token length or images by
+        resolution, so that they stack without padding to the longest input. The key is computed on the raw request,
+        before `decode_request`. Each bucket waits up to `batch_timeout` for its batch to fill.
+
+        Example:
+            ```python
+            def batch_key(self, request):
+                # buckets of 32 tokens
+                return len(self.tokenizer(request["text"])) // 32
+            ```
+
+        """
+        return None
+
     def predict(self, x, **kwargs):
         """Run the model on the input and return or yield the output.
 
@@ -0,0 +1,97 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Optional
+
+
+class AdaptiveBatchTimeout:
+    """Pick how long to wait for a batch to fill from the observed load, used with ``batch_timeout="auto"``.
+
+    The controller keeps an exponentially weighted moving average (EWMA) of the time between request arrivals and of
+    the time it takes to process a batch of each size. A batch waits for more requests only while it is expected to
+    grow, and never so long that its oldest request would miss ``latency_slo`` once the batch is processed. At low
+    traffic batches are sent right away, at high traffic they wait to fill up.
+
+    Args:
+        latency_slo: Target end-to-end latency of a request in seconds, from the time it was enqueued.
+        alpha: Weight of the newest observation in the moving averages.
+
+    """
+
+    def __init__(self, latency_slo: float, alpha: float = 0.2):
+        if latency_slo <= 0:
+            raise ValueError("latency_slo must be greater than 0")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.latency_slo = latency_slo
+        self.alpha = alpha
+        self._last_arrival: Optional[float] = None
+        self._interarrival: Optional[float] = None
+        self._batch_durations: dict[int, float] = {}
+
+    def _ewma(self, average: Optional[float], value: float) -> float:
+        return value if average is None else average + self.alpha * (value - average)
+
+    @property
+    def interarrival_time(self) -> Optional[float]:
+        """Average time between two requests in seconds, None until two requests were seen."""
+        return self._interarrival
+
+    def observe_arrival(self, timestamp: float) -> None:
+        """Record a request enqueued at ``timestamp`` (``time.monotonic()`` of the API server)."""
+        if self._last_arrival is not None:
+            # requests from several API servers can be slightly out of order
+            self._interarrival = self._ewma(self._interarrival, max(timestamp - self._last_arrival, 0.0))
+        self._last_arrival = max(timestamp, self._last_arrival or timestamp)
+
+    def observe_batch(self, batch_size: int, duration: float) -> None:
+        """Record that a batch of ``batch_size`` requests took ``duration`` seconds to process."""
+        self._batch_durations[batch_size] = self._ewma(self._batch_durations.get(batch_size), duration)
+
+    def predict_duration(self, batch_size: int) -> float:
+        """Expected processing time of a batch, interpolated from the closest batch sizes seen so far."""
+        durations = self._batch_durations
+        if batch_size in durations:
+            return durations[batch_size]
+        smaller = max((size for size in durations if size < batch_size), default=None)
+        larger = min((size for size in durations if size > batch_size), default=None)
+        if smaller is not None and larger is not None:
+            fraction = (batch_size - smaller) / (larger - smaller)
+            return durations[smaller] + fraction * (durations[larger] - durations[smaller])
+        if smaller is not None:
+            # assume linear scaling above the largest batch seen, which overestimates for most models
+            return durations[smaller] * batch_size / smaller
+        if larger is not None:
+            return durations[larger]
+        return 0.0
+
+    def wait_time(self, oldest_timestamp: float, batch_size: int, max_batch_size: int, now: float) -> float:
+        """How much longer a batch of ``batch_size`` requests should wait for more, 0 to process it right away.
+
+        Args:
+            oldest_timestamp: Enqueue time of the oldest request in the batch.
+            batch_size: Number of requests collected so far.
+            max_batch_size: Size at which the batch is processed regardless.
+            now: Current ``time.monotonic()``.
+
+        """
+        interarrival = self._interarrival
+        if batch_size >= max_batch_size or interarrival is None:
+            return 0.0
+        time_to_fill = (max_batch_size - batch_size) * interarrival
+        budget = oldest_timestamp + self.latency_slo - now - self.predict_duration(max_batch_size)
+        wait = min(time_to_fill, budget)
+        # not even one more request is expected within the window
+        if wait < interarrival:
+            return 0.0
+        return wait
@@ -20,6 +20,8 @@ import signal
 import sys
 import time
 from abc import ABC
+from collections import deque
+from contextlib import suppress
 from queue import Empty, Queue
 from typing import Any, Optional, Union
 
@@ -96,74 +98,209 @@ class _StopLoopError(Exception):
         super().__init__(self.message)
 
 
+# how long an idle batched worker blocks on the request queue before returning an empty batch
+_IDLE_TIMEOUT = 1.0
+
+
 def collate_requests(
     loop: "LitLoop",
     lit_api: LitAPI,
     request_queue: Queue,
     transport: MessageTransport,
 ) -> tuple[list, list]:
+    """Collect the next batch of requests from ``request_queue``.
+
+    Blocks until the first request arrives, or returns an empty batch if none came within ``_IDLE_TIMEOUT``. Then takes
+    the requests that are already queued and, while the batch is not full, waits for more until ``batch_timeout`` has
+    passed since the first one. Nothing is polled, so an idle worker doesn't use any CPU.
+
+    """
     payloads = []
     timed_out_uids = []
-    entered_at = time.monotonic()
-    end_time = entered_at + lit_api.batch_timeout
     apply_timeout = lit_api.request_timeout not in (-1, False)
+    adaptive_timeout = lit_api._adaptive_batch_timeout if lit_api.batch_timeout == "auto" else None
+    oldest_timestamp = None
 
-    if lit_api.batch_timeout == 0:
-        while len(payloads) < lit_api.max_batch_size:
-            try:
-                request_data = request_queue.get_nowait()
-                if request_data == _SENTINEL_VALUE:
-                    raise _StopLoopError()
-
-                response_queue_id, uid, timestamp, x_enc = request_data
-
-                loop.put_response(
-                    transport=transport,
-                    response_queue_id=response_queue_id,
-                    uid=uid,
-                    response_data=(),
-                    status=LitAPIStatus.START,
-                    response_type=LoopResponseType.STREAMING if lit_api.stream else LoopResponseType.REGULAR,
+    try:
+        request_data = request_queue.get(timeout=_IDLE_TIMEOUT)
+    except Empty:
+        return payloads, timed_out_uids
+
+    # the adaptive window is picked once the first request is in the batch
+    batch_timeout = 0 if adaptive_timeout is not None else lit_api.batch_timeout
+    end_time = time.monotonic() + batch_timeout
+    while True:
+        if request_data == _SENTINEL_VALUE:
+            raise _StopLoopError()
+
+        response_queue_id, uid, timestamp, x_enc = request_data
+
+        loop.put_response(
+            transport=transport,
+            response_queue_id=response_queue_id,
+            uid=uid,
+            response_data=(),
+            status=LitAPIStatus.START,
+            response_type=LoopResponseType.STREAMING if lit_api.stream else LoopResponseType.REGULAR,
+        )
+
+        if adaptive_timeout is not None:
+            adaptive_timeout.observe_arrival(timestamp)
+
+        if apply_timeout and time.monotonic() - timestamp > lit_api.request_timeout:
+            timed_out_uids.append((response_queue_id, uid))
+        else:
+            payloads.append((response_queue_id, uid, x_enc))
+            if adaptive_timeout is not None:
+                if oldest_timestamp is None:
+                    oldest_timestamp = timestamp
+                now = time.monotonic()
+                end_time = now + adaptive_timeout.wait_time(
+                    oldest_timestamp, len(payloads), lit_api.max_batch_size, now
                 )
 
-                if apply_timeout and time.monotonic() - timestamp > lit_api.request_timeout:
-                    timed_out_uids.append((response_queue_id, uid))
-                else:
-                    payloads.append((response_queue_id, uid, x_enc))
+        if len(payloads) >= lit_api.max_batch_size:
+            break
+
+        try:
+            request_data = request_queue.get_nowait()
+        except Empty:
+            remaining_time = end_time - time.monotonic()
+            if remaining_time <= 0:
+                break
+            try:
+                request_data = request_queue.get(timeout=remaining_time)
             except Empty:
                 break
-        return payloads, timed_out_uids
 
-    while time.monotonic() < end_time and len(payloads) < lit_api.max_batch_size:
-        remaining_time = end_time - time.monotonic()
-        if remaining_time <= 0:
-            break
+    return payloads, timed_out_uids
+
+
+def _overrides_batch_key(lit_api: LitAPI) -> bool:
+    return getattr(type(lit_api), "batch_key", LitAPI.batch_key) is not LitAPI.batch_key
+
+
+class BucketedCollator:
+    """Collect batches of requests that share the same ``LitAPI.batch_key``.
+
+    Requests are taken off the request queue as they arrive and kept in one sub-queue per bucket inside the worker. A
+    bucket is sent once it holds ``max_batch_size`` requests or once its oldest request has waited ``batch_timeout``,
+    and when several buckets are ready the one holding the oldest request goes first. Requests that exceed the request
+    timeout while they wait in a bucket are reported as timed out.
+
+    """
+
+    def __init__(self):
+        # bucket key -> deque of (response_queue_id, uid, timestamp, x_enc, received_at)
+        self._buckets: dict[Any, deque] = {}
+
+    def _add(
+        self,
+        request_data: tuple,
+        loop: "LitLoop",
+        lit_api: LitAPI,
+        transport: MessageTransport,
+        timed_out_uids: list,
+    ) -> None:
+        if request_data == _SENTINEL_VALUE:
+            raise _StopLoopError()
+
+        response_queue_id, uid, timestamp, x_enc = request_data
+        response_type = LoopResponseType.STREAMING if lit_api.stream else LoopResponseType.REGULAR
+        loop.put_response(
+            transport=transport,
+            response_queue_id=response_queue_id,
+            uid=uid,
+            response_data=(),
+            status=LitAPIStatus.START,
+            response_type=response_type,
+        )
+
+        if lit_api.batch_timeout == "auto":
+            lit_api._adaptive_batch_timeout.observe_arrival(timestamp)
+
+        if self._timed_out(lit_api, timestamp):
+            timed_out_uids.append((response_queue_id, uid))
+            return
 
         try:
-            request_data = request_queue.get(timeout=min(remaining_time, 0.001))
-            if request_data == _SENTINEL_VALUE:
-                raise _StopLoopError()
-
-            response_queue_id, uid, timestamp, x_enc = request_data
-
-            loop.put_response(
-                transport=transport,
-                response_queue_id=response_queue_id,
-                uid=uid,
-                response_data=(),
-                status=LitAPIStatus.START,
-                response_type=LoopResponseType.STREAMING if lit_api.stream else LoopResponseType.REGULAR,
-            )
+            key = lit_api.batch_key(x_enc)
+        except Exception as e:
+            logger.exception("LitAPI ran into an error in batch_key.\nPlease check the error trace for more details.")
+            loop.put_error_response(transport, response_queue_id, uid, e, response_type)
+            return
 
-            if apply_timeout and time.monotonic() - timestamp > lit_api.request_timeout:
+        bucket = self._buckets.setdefault(key, deque())
+        bucket.append((response_queue_id, uid, timestamp, x_enc, time.monotonic()))
+
+    @staticmethod
+    def _timed_out(lit_api: LitAPI, timestamp: float) -> bool:
+        return lit_api.request_timeout not in (-1, False) and time.monotonic() - timestamp > lit_api.request_timeout
+
+    @staticmethod
+    def _wait_time(lit_api: LitAPI, bucket: deque, now: float) -> float:
+        if len(bucket) >= lit_api.max_batch_size:
+            return 0.0
+        _, _, timestamp, _, received_at = bucket[0]
+        if lit_api.batch_timeout == "auto":
+            return lit_api._adaptive_batch_timeout.wait_time(timestamp, len(bucket), lit_api.max_batch_size, now)
+        return received_at + lit_api.batch_timeout - now
+
+    def _ready_bucket(self, lit_api: LitAPI) -> Optional[Any]:
+        now = time.monotonic()
+        ready = [key for key, bucket in self._buckets.items() if self._wait_time(lit_api, bucket, now) <= 0]
+        if not ready:
+            return None
+        return min(ready, key=lambda key: self._buckets[key][0][4])
+
+    def collate(
+        self,
+        loop: "LitLoop",
+        lit_api: LitAPI,
+        request_queue: Queue,
+        transport: MessageTransport,
+    ) -> tuple[list, list]:
+        payloads = []
+        timed_out_uids = []
+
+        if not self._buckets:
+            try:
+                request_data = request_queue.get(timeout=_IDLE_TIMEOUT)
+            except Empty:
+                return payloads, timed_out_uids
+            self._add(request_data, loop, lit_api, transport, timed_out_uids)
+
+        while True:
+            # sort what is already queued into the buckets
+            with suppress(Empty):
+                while not any(len(bucket) >= lit_api.max_batch_size for bucket in self._buckets.values()):
+                    self._add(request_queue.get_nowait(), loop, lit_api, transport, timed_out_uids)
+
+            key = self._ready_bucket(lit_api)
+            if key is not None:
+                break
+            if not self._buckets:
+                # everything received was rejected, report it right away
+                return payloads, timed_out_uids
+
+            now = time.monotonic()
+            remaining_time = min(self._wait_time(lit_api, bucket, now) for bucket in self._buckets.values())
+            try:
+                request_data = request_queue.get(timeout=max(remaining_time, 0))
+            except Empty:
+                continue
+            self._add(request_data, loop, lit_api, transport, timed_out_uids)
+
+        bucket = self._buckets[key]
+        while bucket and len(payloads) < lit_api.max_batch_size:
+            response_queue_id, uid, timestamp, x_enc, _ = bucket.popleft()
+            if self._timed_out(lit_api, timestamp):
                 timed_out_uids.append((response_queue_id, uid))
             else:
                 payloads.append((response_queue_id, uid, x_enc))
-
-        except Empty:
-            continue
-
-    return payloads, timed_out_uids
+        if not bucket:
+            del self._buckets[key]
+        return payloads, timed_out_uids
 
 
 class _BaseLoop(ABC):
@@ -323,6 +460,11 @@ class LitLoop(_BaseLoop):
         request_queue: Queue,
         transport: MessageTransport,
     ) -> tuple[list, list]:
+        if _overrides_batch_key(lit_api):
+            if self._bucketed_collator is None:
+                self._bucketed_collator = BucketedCollator()
+            return self._bucketed_collator.collate(self, lit_api, request_queue, transport)
+
         batches, timed_out_uids = collate_requests(
             loop=self,
             lit_api=lit_api,
@@ -376,6 +518,8 @@ class LitLoop(_BaseLoop):
 
 
 class DefaultLoop(LitLoop):
+    _bucketed_collator: Optional[BucketedCollator] = None
+
     def pre_setup(self, lit_api: LitAPI, spec: Optional[LitSpec] = None):
         # we will sanitize regularly if no spec
         # in case, we have spec then:
@@ -349,6 +349,7 @@ class BatchedLoop(DefaultLoop):
             logger.debug(f"{len(batches)} batched requests received")
             response_queue_ids, uids, inputs = zip(*batches)
             num_inputs = len(inputs)
+            started_at = time.monotonic()
             try:
                 contexts = [{} for _ in range(num_inputs)]
                 if hasattr(lit_spec, "populate_context"):
@@ -395,6 +396,8 @@ class BatchedLoop(DefaultLoop):
                     self.put_response(
                         transport, response_queue_id, uid, y_enc, LitAPIStatus.OK, LoopResponseType.REGULAR
                     )
+                if lit_api.batch_timeout == "auto":
+                    lit_api._adaptive_batch_timeout.observe_batch(num_inputs, time.monotonic() - started_at)
 
             except HTTPException as e:
                 for response_queue_id, uid in zip(response_queue_ids, uids):
@@ -21,7 +21,7 @@ from fastapi import HTTPException
 
 from litserve import LitAPI
 from litserve.callbacks import CallbackRunner, EventTypes
-from litserve.loops.base import _SENTINEL_VALUE, DefaultLoop, _async_inject_context, _inject_context, collate_requests
+from litserve.loops.base import _SENTINEL_VALUE, DefaultLoop, _async_inject_context, _inject_context
 from litserve.specs.base import LitSpec
 from litserve.transport.base import MessageTransport
 from litserve.utils import LitAPIStatus, LoopResponseType, PickleableHTTPException
@@ -305,12 +305,7 @@ class BatchedStreamingLoop(DefaultLoop):
     ):
         lit_spec = lit_api.spec
         while True:
-            batches, timed_out_uids = collate_requests(
-                loop=self,
-                lit_api=lit_api,
-                request_queue=request_queue,
-                transport=transport,
-            )
+            batches, timed_out_uids = self.get_batch_requests(lit_api, request_queue, transport)
             for response_queue_id, uid in timed_out_uids:
                 logger.error(
                     f"Request {uid} was waiting in the queue for too long ({lit_api.request_timeout} seconds) and "
@@ -330,6 +325,7 @@ class BatchedStreamingLoop(DefaultLoop):
                 continue
             response_queue_ids, uids, inputs = zip(*batches)
             num_inputs = len(inputs)
+            started_at = time.monotonic()
             try:
                 contexts = [{} for _ in range(num_inputs)]
                 if hasattr(lit_spec, "populate_context"):
@@ -360,12 +356,17 @@ class BatchedStreamingLoop(DefaultLoop):
                 callback_runner.trigger_event(EventTypes.AFTER_ENCODE_RESPONSE.value, lit_api=lit_api)
 
                 # y_enc_iter -> [[response-1, response-2], [response-1, response-2]]
+                first_chunk = True
                 for y_batch in y_enc_iter:
                     for response_queue_id, y_enc, uid in zip(response_queue_ids, y_batch, uids):
                         y_enc = lit_api.format_encoded_response(y_enc)
                         self.put_response(
                             transport, response_queue_id, uid, y_enc, LitAPIStatus.OK, LoopResponseType.STREAMING
                         )
+                    if first_chunk and lit_api.batch_timeout == "auto":
+                        # for streams the latency that matters is the time to the first chunk
+                        lit_api._adaptive_batch_timeout.observe_batch(num_inputs, time.monotonic() - started_at)
+                    first_chunk = False
 
                 for response_queue_id, uid in zip(response_queue_ids, uids):
                     self.put_response(
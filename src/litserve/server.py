@@ -18,6 +18,8 @@ import inspect
 import json
 import logging
 import multiprocessing as mp
+import multiprocessing.queues
+import multiprocessing.util
 import os
 import pickle
 import secrets
@@ -51,7 +53,12 @@ from litserve.middlewares import MaxSizeMiddleware, RequestCountMiddleware
 from litserve.python_client import client_template
 from litserve.specs.base import LitSpec
 from litserve.transport.base import MessageTransport
-from litserve.transport.factory import TransportConfig, create_transport_from_config
+from litserve.transport.dispatcher import RequestDispatcher
+from litserve.transport.factory import (
+    TransportConfig,
+    create_request_queue_from_config,
+    create_transport_from_config,
+)
 from litserve.utils import (
     LitAPIStatus,
     LoopResponseType,
@@ -61,6 +68,7 @@ from litserve.utils import (
     call_after_stream,
     configure_logging,
     is_package_installed,
+    put_request,
 )
 
 _MCP_AVAILABLE = is_package_installed("mcp")
@@ -94,10 +102,21 @@ def api_key_auth(x_api_key: str = Depends(APIKeyHeader(name="X-API-Key"))):
         )
 
 
+# responses dispatched per await of the transport, batched streaming sends max_batch_size of them per step
+_MAX_RESPONSES_PER_RECEIVE = 256
+
+
+def _is_final_response(status: LitAPIStatus, response_type: LoopResponseType) -> bool:
+    if response_type == LoopResponseType.STREAMING:
+        return status in (LitAPIStatus.FINISH_STREAMING, LitAPIStatus.ERROR)
+    return status != LitAPIStatus.START
+
+
 async def _mixed_response_to_buffer(
     transport: MessageTransport,
     response_buffer: dict[str, ResponseBufferItem],
     consumer_id: int = 0,
+    on_complete: Optional[Callable[[str], None]] = None,
 ):
     """Handle both regular and streaming responses.
 
@@ -106,26 +125,25 @@ async def _mixed_response_to_buffer(
     """
     while True:
         try:
-            result = await transport.areceive(consumer_id)
-            if result is None:
-                continue
-
-            uid, (*response, response_type, worker_id) = result
-
-            response_item = response_buffer.get(uid)
-            if response_item is None:
-                continue
+            for uid, (*response, response_type, worker_id) in await transport.areceive_many(
+                consumer_id, _MAX_RESPONSES_PER_RECEIVE
+            ):
+                if on_complete is not None and _is_final_response(response[1], response_type):
+                    on_complete(uid)
+                response_item = response_buffer.get(uid)
+                if response_item is None:
+                    continue
 
-            if response[1] == LitAPIStatus.START:
-                response_item.worker_id = int(worker_id)
-                continue
+                if response[1] == LitAPIStatus.START:
+                    response_item.worker_id = int(worker_id)
+                    continue
 
-            if response_type == LoopResponseType.STREAMING:
-                response_item.response_queue.append(response)
-                response_item.event.set()
-            else:
-                response_item.response = response
-                response_item.event.set()
+                if response_type == LoopResponseType.STREAMING:
+                    response_item.response_queue.append(response)
+                    response_item.event.set()
+                else:
+                    response_item.response = response
+                    response_item.event.set()
         except asyncio.CancelledError:
             logger.debug("Response queue to buffer task was cancelled")
             break
@@ -139,35 +157,40 @@ async def response_queue_to_buffer(
     response_buffer: dict[str, ResponseBufferItem],
     consumer_id: int,
     litapi_connector: "_LitAPIConnector",
+    on_complete: Optional[Callable[[str], None]] = None,
 ):
+    """Move the responses received on ``consumer_id`` into ``response_buffer``.
+
+    ``on_complete`` is called with the uid of every request whose final response arrives.
+
+    """
     mixed_streaming = (
         len(litapi_connector.lit_apis) > 1
         and litapi_connector.any_stream()
         and not all(api.stream for api in litapi_connector)
     )
     if mixed_streaming:
-        return await _mixed_response_to_buffer(transport, response_buffer, consumer_id)
+        return await _mixed_response_to_buffer(transport, response_buffer, consumer_id, on_complete)
 
     stream = litapi_connector.any_stream()
     if stream:
         while True:
             try:
-                result = await transport.areceive(consumer_id)
-                if result is None:
-                    continue
-
-                uid, (*response, response_type, worker_id) = result
-
-                response_item = response_buffer.get(uid)
-                if response_item is None:
-                    continue
-
-                if response[1] == LitAPIStatus.START:
-                    response_item.worker_id = int(worker_id)
-                    continue
-
-                response_item.response_queue.append(response)
-                response_item.event.set()
+                for uid, (*response, response_type, worker_id) in await transport.areceive_many(
+                    consumer_id, _MAX_RESPONSES_PER_RECEIVE
+                ):
+                    if on_complete is not None and _is_final_response(response[1], response_type):
+                        on_complete(uid)
+                    response_item = response_buffer.get(uid)
+                    if response_item is None:
+                        continue
+
+                    if response[1] == LitAPIStatus.START:
+                        response_item.worker_id = int(worker_id)
+                        continue
+
+                    response_item.response_queue.append(response)
+                    response_item.event.set()
             except asyncio.CancelledError:
                 logger.debug("Response queue to buffer task was cancelled")
                 break
@@ -178,22 +201,21 @@ async def response_queue_to_buffer(
     else:
         while True:
             try:
-                result = await transport.areceive(consumer_id)
-                if result is None:
-                    continue
-
-                uid, (*response, response_type, worker_id) = result
-
-                response_item = response_buffer.get(uid)
-                if response_item is None:
-                    continue
-
-                if response[1] == LitAPIStatus.START:
-                    response_item.worker_id = int(worker_id)
-                    continue
-
-                response_item.response = response
-                response_item.event.set()
+                for uid, (*response, response_type, worker_id) in await transport.areceive_many(
+                    consumer_id, _MAX_RESPONSES_PER_RECEIVE
+                ):
+                    if on_complete is not None and _is_final_response(response[1], response_type):
+                        on_complete(uid)
+                    response_item = response_buffer.get(uid)
+                    if response_item is None:
+                        continue
+
+                    if response[1] == LitAPIStatus.START:
+                        response_item.worker_id = int(worker_id)
+                        continue
+
+                    response_item.response = response
+                    response_item.event.set()
             except asyncio.CancelledError:
                 logger.debug("Response queue to buffer task was cancelled")
                 break
@@ -202,6 +224,12 @@ async def response_queue_to_buffer(
                 break
 
 
+def _terminate_at_exit(process: mp.Process) -> None:
+    # Workers blocked on a native request queue never notice that the server is gone, and multiprocessing joins them
+    # at interpreter exit. Priority 0 finalizers run before that join.
+    mp.util.Finalize(None, process.terminate, exitpriority=0)
+
+
 def _migration_warning(feature_name):
     warnings.warn(
         f"The {feature_name} parameter is being deprecated in `LitServer` "
@@ -268,7 +296,7 @@ class _LitAPIConnector:
             lit_api.request_timeout = timeout
 
         for lit_api in self.lit_apis:
-            if lit_api.batch_timeout > timeout and timeout not in (False, -1):
+            if lit_api.batch_timeout != "auto" and lit_api.batch_timeout > timeout and timeout not in (False, -1):
                 raise ValueError("batch_timeout must be less than request_timeout")
 
     def __iter__(self):
@@ -316,7 +344,7 @@ class BaseRequestHandler(ABC):
             litserver=self.server,
         )
 
-        request_queue.put((response_queue_id, uid, time.monotonic(), payload))
+        await put_request(request_queue, (response_queue_id, uid, time.monotonic(), payload))
         logger.debug(f"Submitted request uid={uid}")
         return uid, response_queue_id
 
@@ -488,11 +516,22 @@ class LitServer:
             - Decrease for fast models (e.g., 5 for lightweight models)
 
         fast_queue:
-            Enable ZeroMQ for high-throughput scenarios (>100 RPS). Defaults to False.
+            Enable a faster transport between inference workers and API servers for high-throughput
+            scenarios (>100 RPS). Defaults to False.
 
+            - True or "zmq": Use ZeroMQ
+            - "shm": Use shared memory ring buffers, which avoids the manager process on the response path
             - Use when serving hundreds of requests per second
             - Not supported on Windows
 
+        request_dispatch:
+            How requests are handed to the inference workers of a LitAPI. Defaults to "shared".
+
+            - "shared": All workers take requests from a single shared queue
+            - "least_loaded": Each worker has its own queue, requests go to the worker with the fewest in flight
+            - "power_of_two": Like "least_loaded", but compares two workers picked at random
+            - Helps tail latency when workers run at different speeds (e.g., mixed devices)
+
         track_requests:
             Track active requests across all API servers for monitoring and load management. Defaults to False.
 
@@ -716,7 +755,8 @@ class LitServer:
         callbacks: Optional[Union[list[Callback], Callback]] = None,
         middlewares: Optional[list[Union[Callable, tuple[Callable, dict]]]] = None,
         loggers: Optional[Union[Logger, list[Logger]]] = None,
-        fast_queue: bool = False,
+        fast_queue: Union[bool, Literal["zmq", "shm"]] = False,
+        request_dispatch: Literal["shared", "least_loaded", "power_of_two"] = "shared",
         disable_openapi_url: bool = False,
         # All the following arguments are deprecated and will be removed in v0.3.0
         max_batch_size: Optional[int] = None,
@@ -812,6 +852,14 @@ class LitServer:
         except (TypeError, ValueError):
             raise ValueError("model_metadata must be JSON serializable.")
 
+        if fast_queue not in (True, False, "zmq", "shm"):
+            raise ValueError(f"fast_queue must be a boolean, 'zmq' or 'shm' but got {fast_queue!r}")
+
+        if request_dispatch not in ("shared", "least_loaded", "power_of_two"):
+            raise ValueError(
+                f"request_dispatch must be 'shared', 'least_loaded' or 'power_of_two' but got {request_dispatch!r}"
+            )
+
         if sys.platform == "win32" and fast_queue:
             warnings.warn("ZMQ is not supported on Windows with LitServe. Disabling ZMQ.")
             fast_queue = False
@@ -844,7 +892,8 @@ class LitServer:
         self.model_metadata = model_metadata
         self._connector = _Connector(accelerator=accelerator, devices=devices)
         self._callback_runner = CallbackRunner(callbacks)
-        self.use_zmq = fast_queue
+        self.use_zmq = fast_queue in (True, "zmq")
+        self.use_shm = fast_queue == "shm"
         self.transport_config = None
         self.litapi_request_queues = {}
         self._shutdown_event: Optional[mp.Event] = None
@@ -865,7 +914,16 @@ class LitServer:
                 device_list = range(devices)
             self.devices = [self.device_identifiers(accelerator, device) for device in device_list]
 
-        self.transport_config = TransportConfig(transport_config="zmq" if self.use_zmq else "mp")
+        transport_type = "zmq" if self.use_zmq else "shm" if self.use_shm else "mp"
+        # manager queues survive a worker dying while it holds the queue lock
+        mp_queue_type = "manager" if self.restart_workers else "mp"
+        request_queue_type = transport_type if transport_type != "mp" else mp_queue_type
+        self.transport_config = TransportConfig(
+            transport_type=transport_type,
+            request_queue_type=request_queue_type,
+            response_queue_type=mp_queue_type,
+            request_dispatch=request_dispatch,
+        )
         self.register_endpoints()
         # register middleware
         self._register_middleware()
@@ -901,7 +959,7 @@ class LitServer:
                     lit_api,
                     device,
                     worker_id,
-                    self._get_request_queue(lit_api.api_path),
+                    self._get_worker_request_queue(lit_api.api_path, worker_id),
                     self._transport,
                     self.workers_setup_status,
                     self._callback_runner,
@@ -910,6 +968,7 @@ class LitServer:
                 name="inference-worker",
             )
             process.start()
+            _terminate_at_exit(process)
             process_list.append(process)
         return process_list
 
@@ -937,7 +996,7 @@ class LitServer:
                 lit_api,
                 device,
                 worker_id,
-                self._get_request_queue(lit_api.api_path),
+                self._get_worker_request_queue(lit_api.api_path, worker_id),
                 self._transport,
                 self.workers_setup_status,
                 self._callback_runner,
@@ -947,6 +1006,7 @@ class LitServer:
         )
 
         process.start()
+        _terminate_at_exit(process)
         return process
 
     @asynccontextmanager
@@ -961,11 +1021,13 @@ class LitServer:
             )
 
         transport = self._transport
+        dispatched = any(isinstance(queue, RequestDispatcher) for queue in self.litapi_request_queues.values())
         future = response_queue_to_buffer(
             transport,
             self.response_buffer,
             app.response_queue_id,
             self.litapi_connector,
+            self._complete_request if dispatched else None,
         )
         task = loop.create_task(future, name=f"response_queue_to_buffer-{app.response_queue_id}")
         task.add_done_callback(
@@ -1096,6 +1158,17 @@ class LitServer:
     def _get_request_queue(self, api_path: str):
         return self.litapi_request_queues[api_path]
 
+    def _get_worker_request_queue(self, api_path: str, worker_id: int):
+        request_queue = self.litapi_request_queues[api_path]
+        if isinstance(request_queue, RequestDispatcher):
+            return request_queue.worker_queue(worker_id)
+        return request_queue
+
+    def _complete_request(self, uid: str) -> None:
+        for request_queue in self.litapi_request_queues.values():
+            if isinstance(request_queue, RequestDispatcher):
+                request_queue.complete(uid)
+
     def _register_api_endpoints(self, lit_api: LitAPI, request_type, response_type):
         """Register endpoint routes for the FastAPI app."""
 
@@ -1172,7 +1245,10 @@ class LitServer:
 
         # create request queues for each unique lit_api api_path
         for lit_api in self.litapi_connector:
-            self.litapi_request_queues[lit_api.api_path] = manager.Queue()
+            num_workers = len(self._inference_workers_config_for_api(lit_api.api_path))
+            self.litapi_request_queues[lit_api.api_path] = create_request_queue_from_config(
+                self.transport_config, num_workers
+            )
 
         if self._logger_connector._loggers:
             self.logger_queue = manager.Queue()
@@ -1234,8 +1310,22 @@ class LitServer:
             except Exception as e:
                 logger.error(f"Error while terminating worker {worker_name} (PID: {worker_pid}): {e}")
 
+        self._close_request_queues()
         manager.shutdown()
 
+    def _close_request_queues(self):
+        for request_queue in self.litapi_request_queues.values():
+            if isinstance(request_queue, mp.queues.Queue):
+                # the workers are gone, don't block the interpreter exit on flushing requests nobody will read
+                request_queue.cancel_join_thread()
+            close = getattr(request_queue, "close", None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                logger.debug(f"Error while closing request queue: {e}")
+
     def _resolve_workers_per_device_config(self, workers_per_device):
         """Resolve workers_per_device into a dict[api_path, workers_per_device_int]."""
         api_paths = [api.api_path for api in self.litapi_connector]
@@ -31,7 +31,7 @@ from pydantic import BaseModel, Field
 from litserve.callbacks.base import EventTypes
 from litserve.constants import _DEFAULT_LIT_API_PATH
 from litserve.specs.base import LitSpec, _AsyncSpecWrapper
-from litserve.utils import LitAPIStatus, ResponseBufferItem, azip
+from litserve.utils import LitAPIStatus, ResponseBufferItem, azip, put_request
 
 if typing.TYPE_CHECKING:
     from litserve import LitAPI, LitServer
@@ -517,7 +517,7 @@ class OpenAISpec(LitSpec):
             q = deque()
             event = asyncio.Event()
             self.response_buffer[uid] = ResponseBufferItem(response_queue=q, event=event)
-            self.request_queue.put((response_queue_id, uid, time.monotonic(), request_el))
+            await put_request(self.request_queue, (response_queue_id, uid, time.monotonic(), request_el))
             self.queues.append(q)
             self.events.append(event)
 
@@ -27,7 +27,7 @@ from pydantic import BaseModel
 from litserve.callbacks.base import EventTypes
 from litserve.constants import _DEFAULT_LIT_API_PATH
 from litserve.specs.base import LitSpec
-from litserve.utils import LitAPIStatus, ResponseBufferItem
+from litserve.utils import LitAPIStatus, ResponseBufferItem, put_request
 
 logger = logging.getLogger(__name__)
 
@@ -269,7 +269,7 @@ class OpenAIEmbeddingSpec(LitSpec):
             litserver=self._server,
         )
 
-        self.request_queue.put_nowait((response_queue_id, uid, time.monotonic(), request.model_copy()))
+        await put_request(self.request_queue, (response_queue_id, uid, time.monotonic(), request.model_copy()))
         await event.wait()
 
         response_buffer_item = self.response_buffer.pop(uid)
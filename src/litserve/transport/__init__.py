@@ -1,4 +1,15 @@
+from .codec import Codec, EnvelopeCodec, PickleCodec
+from .dispatcher import RequestDispatcher
 from .process_transport import MPQueueTransport
+from .shm_transport import SharedMemoryTransport
 from .zmq_transport import ZMQTransport
 
-__all__ = ["ZMQTransport", "MPQueueTransport"]
+__all__ = [
+    "ZMQTransport",
+    "MPQueueTransport",
+    "SharedMemoryTransport",
+    "Codec",
+    "EnvelopeCodec",
+    "PickleCodec",
+    "RequestDispatcher",
+]
@@ -3,6 +3,12 @@ from typing import Any, Optional
 
 
 class MessageTransport(ABC):
+    """Carries responses from the inference workers to the API servers.
+
+    Transports that serialize messages themselves do so with a :class:`~litserve.transport.codec.Codec`.
+
+    """
+
     @abstractmethod
     def send(self, item: Any, consumer_id: int) -> None:
         """Send a message to a consumer in the main process."""
@@ -13,6 +19,16 @@ class MessageTransport(ABC):
         """Receive a message from model workers or any publisher."""
         pass
 
+    async def areceive_many(self, consumer_id: int, max_items: int, timeout: Optional[float] = None) -> list:
+        """Receive up to ``max_items`` messages, waiting only for the first one.
+
+        Transports override this to hand a whole burst of messages to the caller in a single await. Returns an empty
+        list when no message arrived.
+
+        """
+        item = await self.areceive(consumer_id=consumer_id, timeout=timeout)
+        return [] if item is None else [item]
+
     def close(self, **kwargs) -> None:
         """Clean up resources if needed (e.g., sockets, processes)."""
         pass
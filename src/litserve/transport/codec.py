@@ -0,0 +1,124 @@
+import struct
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any
+
+from litserve.transport import serialization
+from litserve.transport.serialization import Buffer
+from litserve.utils import LitAPIStatus, LoopResponseType
+
+
+class Codec(ABC):
+    """Turns transport messages into a list of frames and back."""
+
+    @abstractmethod
+    def encode(self, item: Any) -> list[Buffer]:
+        pass
+
+    @abstractmethod
+    def decode(self, frames: list[Buffer]) -> Any:
+        pass
+
+
+class PickleCodec(Codec):
+    """Pickle every message, large buffers are sent out-of-band."""
+
+    def encode(self, item: Any) -> list[Buffer]:
+        return serialization.dumps(item)
+
+    def decode(self, frames: list[Buffer]) -> Any:
+        return serialization.loads(frames)
+
+
+# A pickle stream always starts with the PROTO opcode (0x80), so this byte tells envelopes apart from pickles
+_ENVELOPE_MAGIC = 0x4C
+# magic, status, response type, uid kind, payload kind, worker id
+_ENVELOPE_HEADER = struct.Struct("<BBBBBi")
+
+_STATUSES = [LitAPIStatus.START, LitAPIStatus.OK, LitAPIStatus.ERROR, LitAPIStatus.FINISH_STREAMING]
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_RESPONSE_TYPES = list(LoopResponseType)
+_RESPONSE_TYPE_CODES = {response_type: code for code, response_type in enumerate(_RESPONSE_TYPES)}
+
+_UID_UUID = 0
+_UID_UUID_STR = 1
+_UID_STR = 2
+
+_PAYLOAD_NONE = 0
+_PAYLOAD_BYTES = 1
+_PAYLOAD_STR = 2
+
+
+def _encode_uid(uid: Any) -> tuple[int, bytes]:
+    if isinstance(uid, uuid.UUID):
+        return _UID_UUID, uid.bytes
+    if len(uid) == 36:
+        try:
+            parsed = uuid.UUID(uid)
+        except ValueError:
+            parsed = None
+        # only canonical strings survive the round trip through 16 bytes
+        if parsed is not None and str(parsed) == uid:
+            return _UID_UUID_STR, parsed.bytes
+    return _UID_STR, uid.encode()
+
+
+def _decode_uid(kind: int, data: bytes) -> Any:
+    if kind == _UID_UUID:
+        return uuid.UUID(bytes=data)
+    if kind == _UID_UUID_STR:
+        return str(uuid.UUID(bytes=data))
+    return data.decode()
+
+
+class EnvelopeCodec(PickleCodec):
+    """Compact binary envelope for responses whose payload is already encoded.
+
+    Messages of the form ``(uid, (response_data, status, response_type, worker_id))`` with a ``str``/``bytes``/``None``
+    payload are sent as a small fixed header (status and response type as one byte each, uid as 16 raw bytes when it is
+    a UUID) followed by the raw payload. Anything else falls back to pickle.
+
+    """
+
+    def encode(self, item: Any) -> list[Buffer]:
+        try:
+            uid, (data, status, response_type, worker_id) = item
+            status_code = _STATUS_CODES[status]
+            response_type_code = _RESPONSE_TYPE_CODES[response_type]
+        except (TypeError, ValueError, KeyError):
+            return super().encode(item)
+        if not isinstance(uid, (str, uuid.UUID)) or type(worker_id) is not int:
+            return super().encode(item)
+
+        if data is None:
+            payload_kind, payload = _PAYLOAD_NONE, b""
+        elif type(data) is bytes:
+            payload_kind, payload = _PAYLOAD_BYTES, data
+        elif type(data) is str:
+            payload_kind, payload = _PAYLOAD_STR, data.encode()
+        else:
+            return super().encode(item)
+
+        uid_kind, uid_bytes = _encode_uid(uid)
+        header = _ENVELOPE_HEADER.pack(
+            _ENVELOPE_MAGIC, status_code, response_type_code, uid_kind, payload_kind, worker_id
+        )
+        return [header + uid_bytes, payload]
+
+    def decode(self, frames: list[Buffer]) -> Any:
+        header = frames[0]
+        if header[0] != _ENVELOPE_MAGIC:
+            return super().decode(frames)
+
+        _, status_code, response_type_code, uid_kind, payload_kind, worker_id = _ENVELOPE_HEADER.unpack_from(header)
+        uid = _decode_uid(uid_kind, bytes(header[_ENVELOPE_HEADER.size :]))
+        if payload_kind == _PAYLOAD_NONE:
+            data = None
+        elif payload_kind == _PAYLOAD_STR:
+            data = str(frames[1], "utf-8")
+        else:
+            data = bytes(frames[1])
+        return uid, (data, _STATUSES[status_code], _RESPONSE_TYPES[response_type_code], worker_id)
+
+
+CODECS = {"pickle": PickleCodec, "envelope": EnvelopeCodec}
@@ -0,0 +1,83 @@
+import multiprocessing.queues
+import random
+from contextlib import suppress
+from typing import Any, Literal
+
+DispatchPolicy = Literal["least_loaded", "power_of_two"]
+
+
+class RequestDispatcher:
+    """Spreads the requests of one LitAPI over one request queue per inference worker.
+
+    Every API server counts the requests it has in flight on each worker and enqueues a new request on the worker with
+    the fewest of them (``"least_loaded"``), or on the less loaded of two workers picked at random (``"power_of_two"``).
+    A request stops counting once its final response comes back, see :meth:`complete`.
+
+    The counts are local to the API server process, they start from zero in every process the dispatcher is sent to.
+
+    """
+
+    def __init__(self, queues: list, policy: DispatchPolicy = "least_loaded"):
+        if not queues:
+            raise ValueError("RequestDispatcher needs at least one request queue")
+        if policy not in ("least_loaded", "power_of_two"):
+            raise ValueError(f"Invalid dispatch policy: {policy!r}. Expected 'least_loaded' or 'power_of_two'")
+        self.queues = queues
+        self.policy = policy
+        self._in_flight = [0] * len(queues)
+        self._assigned: dict[Any, int] = {}
+        self._next = 0
+
+    @property
+    def in_flight(self) -> list[int]:
+        """Number of requests in flight on each worker, as seen by this process."""
+        return list(self._in_flight)
+
+    def _pick_worker(self) -> int:
+        num_workers = len(self.queues)
+        if num_workers == 1:
+            return 0
+        if self.policy == "power_of_two":
+            first, second = random.sample(range(num_workers), 2)
+            return first if self._in_flight[first] <= self._in_flight[second] else second
+
+        # start the scan after the last pick so that ties rotate over the workers
+        start = self._next
+        worker_id = min(
+            ((start + offset) % num_workers for offset in range(num_workers)), key=self._in_flight.__getitem__
+        )
+        self._next = (worker_id + 1) % num_workers
+        return worker_id
+
+    def select(self, item: tuple) -> Any:
+        """Assign the request ``item`` to a worker and return that worker's request queue."""
+        uid = item[1]
+        worker_id = self._pick_worker()
+        self._in_flight[worker_id] += 1
+        self._assigned[uid] = worker_id
+        return self.queues[worker_id]
+
+    def put(self, item: tuple, block: bool = True, timeout=None) -> None:
+        self.select(item).put(item, block, timeout)
+
+    def complete(self, uid: Any) -> None:
+        """Mark the request ``uid`` as done, unknown uids are ignored."""
+        worker_id = self._assigned.pop(uid, None)
+        if worker_id is not None:
+            self._in_flight[worker_id] -= 1
+
+    def worker_queue(self, worker_id: int) -> Any:
+        """The request queue consumed by the inference worker ``worker_id``."""
+        return self.queues[worker_id]
+
+    def close(self) -> None:
+        for queue in self.queues:
+            if isinstance(queue, multiprocessing.queues.Queue):
+                queue.cancel_join_thread()
+            close = getattr(queue, "close", None)
+            if close is not None:
+                with suppress(Exception):
+                    close()
+
+    def __reduce__(self):
+        return RequestDispatcher, (self.queues, self.policy)
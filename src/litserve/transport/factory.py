@@ -1,38 +1,102 @@
+import multiprocessing as mp
 from multiprocessing import Manager
 from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from litserve.transport.codec import CODECS
+from litserve.transport.dispatcher import RequestDispatcher
 from litserve.transport.process_transport import MPQueueTransport
-from litserve.transport.zmq_queue import Broker
+from litserve.transport.shm_transport import SharedMemoryQueue, SharedMemoryRing, SharedMemoryTransport
+from litserve.transport.zmq_queue import Broker, ZMQRequestQueue
 from litserve.transport.zmq_transport import ZMQTransport
+from litserve.utils import generate_random_zmq_address
+
+# inference workers are spawned, so shared locks and queues must come from a spawn context
+_SPAWN_CTX = mp.get_context("spawn")
 
 
 class TransportConfig(BaseModel):
-    transport_type: Literal["mp", "zmq"] = "mp"
+    transport_type: Literal["mp", "zmq", "shm"] = "mp"
+    request_queue_type: Literal["manager", "mp", "shm", "zmq"] = "manager"
+    response_queue_type: Literal["manager", "mp"] = "manager"
     num_consumers: int = Field(1, ge=1)
     manager: Optional[Manager] = None
     consumer_id: Optional[int] = None
+    zmq_topology: Literal["direct", "broker"] = "direct"
     frontend_address: Optional[str] = None
     backend_address: Optional[str] = None
+    consumer_addresses: Optional[list[str]] = None
+    shm_buffer_size: int = Field(4 * 1024 * 1024, ge=1024)
+    codec: Literal["envelope", "pickle"] = "envelope"
+    request_dispatch: Literal["shared", "least_loaded", "power_of_two"] = "shared"
 
 
 def _create_zmq_transport(config: TransportConfig):
+    if config.zmq_topology == "direct":
+        # each API server binds its own address and the inference workers connect to all of them
+        config.consumer_addresses = [generate_random_zmq_address() for _ in range(config.num_consumers)]
+        return ZMQTransport(consumer_addresses=config.consumer_addresses, codec=CODECS[config.codec]())
+
     broker = Broker()
     broker.start()
     config.frontend_address = broker.frontend_address
     config.backend_address = broker.backend_address
-    return ZMQTransport(config.frontend_address, config.backend_address)
+    return ZMQTransport(config.backend_address, config.frontend_address, codec=CODECS[config.codec]())
 
 
 def _create_mp_transport(config: TransportConfig):
-    queues = [config.manager.Queue() for _ in range(config.num_consumers)]
+    if config.response_queue_type == "mp":
+        # native queues expose a pipe that the API server can wait on with the event loop
+        queues = [_SPAWN_CTX.Queue() for _ in range(config.num_consumers)]
+    else:
+        queues = [config.manager.Queue() for _ in range(config.num_consumers)]
     return MPQueueTransport(config.manager, queues)
 
 
+def _create_shm_transport(config: TransportConfig):
+    rings = [
+        SharedMemoryRing(config.shm_buffer_size, _SPAWN_CTX.Lock(), _SPAWN_CTX.Pipe(duplex=False))
+        for _ in range(config.num_consumers)
+    ]
+    return SharedMemoryTransport(rings, codec=CODECS[config.codec]())
+
+
 def create_transport_from_config(config: TransportConfig):
     if config.transport_type == "mp":
         return _create_mp_transport(config)
     if config.transport_type == "zmq":
         return _create_zmq_transport(config)
+    if config.transport_type == "shm":
+        return _create_shm_transport(config)
     raise ValueError(f"Invalid transport type: {config.transport_type}")
+
+
+def _create_shm_request_queue(config: TransportConfig):
+    ring = SharedMemoryRing(config.shm_buffer_size, _SPAWN_CTX.Lock())
+    return SharedMemoryQueue(ring, _SPAWN_CTX.Semaphore(0), _SPAWN_CTX.Lock())
+
+
+def _create_request_queue(config: TransportConfig, num_workers: int):
+    if config.request_queue_type == "manager":
+        return config.manager.Queue()
+    if config.request_queue_type == "mp":
+        return _SPAWN_CTX.Queue()
+    if config.request_queue_type == "shm":
+        return _create_shm_request_queue(config)
+    if config.request_queue_type == "zmq":
+        return ZMQRequestQueue([generate_random_zmq_address() for _ in range(num_workers)])
+    raise ValueError(f"Invalid request queue type: {config.request_queue_type}")
+
+
+def create_request_queue_from_config(config: TransportConfig, num_workers: int = 1):
+    """Create the queue that carries requests from the API servers to the inference workers of one LitAPI.
+
+    With ``request_dispatch`` other than ``"shared"``, every worker gets a queue of its own and a
+    :class:`RequestDispatcher` picks one for each request.
+
+    """
+    if config.request_dispatch == "shared":
+        return _create_request_queue(config, num_workers)
+    queues = [_create_request_queue(config, 1) for _ in range(num_workers)]
+    return RequestDispatcher(queues, config.request_dispatch)
@@ -1,15 +1,30 @@
 import asyncio
+import multiprocessing.queues
+from collections import deque
 from contextlib import suppress
 from multiprocessing import Manager, Queue
+from queue import Empty
 from typing import Any, Optional
 
 from litserve.transport.base import MessageTransport
 
+# upper bound on the messages read per wakeup, so that a burst can't starve the event loop
+_MAX_DRAIN = 256
+
 
 class MPQueueTransport(MessageTransport):
+    """Transport over one ``multiprocessing`` queue per consumer.
+
+    With manager queues every receive is a blocking call in a worker thread. Native ``multiprocessing.Queue`` objects
+    are read from the event loop instead: the consumer waits on the queue's pipe with ``loop.add_reader`` and drains
+    all the available messages at each wakeup.
+
+    """
+
     def __init__(self, manager: Manager, queues: list[Queue]):
         self._queues = queues
         self._closed = False
+        self._pending: dict[int, deque] = {}
 
     def send(self, item: Any, consumer_id: int) -> None:
         return self._queues[consumer_id].put(item)
@@ -18,6 +33,10 @@ class MPQueueTransport(MessageTransport):
         if self._closed:
             raise asyncio.CancelledError("Transport closed")
 
+        queue = self._queues[consumer_id]
+        if isinstance(queue, multiprocessing.queues.Queue):
+            return await self._areceive_from_pipe(consumer_id, queue, timeout)
+
         actual_timeout = 1 if timeout is None else min(timeout, 1)
 
         try:
@@ -31,6 +50,77 @@ class MPQueueTransport(MessageTransport):
                 raise
             return None
 
+    async def areceive_many(self, consumer_id: int, max_items: int, timeout: Optional[float] = None) -> list:
+        if self._closed:
+            raise asyncio.CancelledError("Transport closed")
+
+        queue = self._queues[consumer_id]
+        if not isinstance(queue, multiprocessing.queues.Queue):
+            actual_timeout = 1 if timeout is None else min(timeout, 1)
+            try:
+                items = await asyncio.to_thread(self._get_many, queue, max_items, actual_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                if self._closed:
+                    raise asyncio.CancelledError("Transport closed")
+                if timeout is not None and timeout <= actual_timeout:
+                    raise
+                return []
+            return [item for item in items if item is not None]
+
+        items = [await self._areceive_from_pipe(consumer_id, queue, timeout)]
+        pending = self._pending[consumer_id]
+        while pending and len(items) < max_items:
+            items.append(pending.popleft())
+        return [item for item in items if item is not None]
+
+    @staticmethod
+    def _get_many(queue: Queue, max_items: int, timeout: float) -> list:
+        # runs in a worker thread, so the whole burst costs a single thread hop
+        items = [queue.get(timeout=timeout, block=True)]
+        with suppress(Empty):
+            while len(items) < max_items:
+                items.append(queue.get_nowait())
+        return items
+
+    async def _areceive_from_pipe(
+        self, consumer_id: int, queue: multiprocessing.queues.Queue, timeout: Optional[float]
+    ) -> Any:
+        pending = self._pending.setdefault(consumer_id, deque())
+        if pending:
+            return pending.popleft()
+
+        loop = asyncio.get_running_loop()
+        # without a timeout there is no need to wake up periodically, close() sends a sentinel
+        deadline = None if timeout is None else loop.time() + timeout
+        fd = queue._reader.fileno()
+        data_ready = asyncio.Event()
+        while True:
+            self._drain(queue, pending)
+            if pending:
+                return pending.popleft()
+
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                raise Empty
+
+            data_ready.clear()
+            loop.add_reader(fd, data_ready.set)
+            try:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(data_ready.wait(), remaining)
+            finally:
+                loop.remove_reader(fd)
+            if self._closed:
+                raise asyncio.CancelledError("Transport closed")
+
+    @staticmethod
+    def _drain(queue: multiprocessing.queues.Queue, pending: deque) -> None:
+        with suppress(Empty):
+            for _ in range(_MAX_DRAIN):
+                pending.append(queue.get_nowait())
+
     def close(self, send_sentinel: bool = True) -> None:
         # Mark the transport as closed
         self._closed = True
@@ -42,5 +132,10 @@ class MPQueueTransport(MessageTransport):
                 with suppress(Exception):
                     queue.put(None, block=False)
 
+        for queue in self._queues:
+            if isinstance(queue, multiprocessing.queues.Queue):
+                # don't block the interpreter exit on flushing messages that nobody may read anymore
+                queue.cancel_join_thread()
+
     def __reduce__(self):
         return (MPQueueTransport, (None, self._queues))
@@ -0,0 +1,42 @@
+import pickle
+from typing import Any, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Buffers smaller than this are cheaper to copy into the pickle stream than to ship as separate frames
+OUT_OF_BAND_THRESHOLD = 64 * 1024
+
+
+def dumps(item: Any) -> list[Buffer]:
+    """Serialize ``item`` into a list of frames using pickle protocol 5.
+
+    The first frame is the pickle stream, the following frames are the raw out-of-band buffers of large contiguous
+    objects like NumPy arrays. They are views on the original memory, so they must be consumed before ``item`` is
+    mutated.
+
+    """
+    buffers: list[Buffer] = []
+
+    def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        try:
+            raw = buffer.raw()
+        except BufferError:
+            # non-contiguous buffers can't be exported as-is, keep them in the pickle stream
+            return True
+        if raw.nbytes < OUT_OF_BAND_THRESHOLD:
+            return True
+        buffers.append(raw)
+        return False
+
+    payload = pickle.dumps(item, protocol=5, buffer_callback=buffer_callback)
+    return [payload, *buffers]
+
+
+def loads(frames: list[Buffer]) -> Any:
+    """Deserialize frames produced by :func:`dumps`.
+
+    Out-of-band buffers are used without copying, objects reconstructed from them share memory with the frames.
+
+    """
+    payload, *buffers = frames
+    return pickle.loads(payload, buffers=buffers)
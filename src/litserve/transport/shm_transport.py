@@ -0,0 +1,333 @@
+import asyncio
+import ctypes
+import os
+import struct
+import sys
+import time
+from collections.abc import Sequence
+from contextlib import suppress
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+from queue import Empty
+from typing import Any, Optional
+
+from litserve.transport import serialization
+from litserve.transport.base import MessageTransport
+from litserve.transport.codec import Codec, EnvelopeCodec
+from litserve.transport.serialization import Buffer
+
+# head (bytes written) and tail (bytes read) counters, padded to a cache line
+_HEADER_SIZE = 64
+# payload length, record kind
+_RECORD_HEADER = struct.Struct("<II")
+_SPILL_HEADER = struct.Struct("<Q")
+# number of frames in a record, followed by one u64 length per frame
+_FRAME_COUNT = struct.Struct("<I")
+_INLINE = 0
+_SPILLED = 1
+
+
+def _encode_lengths(frames: Sequence[memoryview]) -> bytes:
+    return _FRAME_COUNT.pack(len(frames)) + struct.pack(f"<{len(frames)}Q", *(frame.nbytes for frame in frames))
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    # Only the creating process is responsible for unlinking the ring
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+class SharedMemoryRing:
+    """A byte ring buffer living in ``multiprocessing.shared_memory``.
+
+    Producers serialize their writes with ``lock`` while the single consumer reads without locking and only moves the
+    read cursor. Each write rings a doorbell pipe so an asyncio consumer can sleep on it with ``loop.add_reader``
+    instead of polling. A record is a list of frames (see :mod:`litserve.transport.serialization`) that are copied
+    into the ring one by one. Records larger than the ring are spilled into a dedicated shared memory block which is
+    unlinked by the consumer once read.
+
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        lock,
+        doorbell: Optional[tuple[Connection, Connection]] = None,
+        name: Optional[str] = None,
+    ):
+        self.capacity = capacity
+        self._lock = lock
+        self._doorbell = doorbell
+        self._owner_pid = None
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=_HEADER_SIZE + capacity)
+            self._owner_pid = os.getpid()
+        else:
+            self._shm = _attach_shared_memory(name)
+        self.name = self._shm.name
+        self._head = ctypes.c_uint64.from_buffer(self._shm.buf, 0)
+        self._tail = ctypes.c_uint64.from_buffer(self._shm.buf, 8)
+        self._data = self._shm.buf[_HEADER_SIZE : _HEADER_SIZE + capacity]
+        for conn in doorbell or ():
+            os.set_blocking(conn.fileno(), False)
+
+    def put(self, frames: Sequence[Buffer]) -> None:
+        """Write one record made of ``frames``, copying each frame straight into shared memory."""
+        frames = [memoryview(frame).cast("B") for frame in frames]
+        lengths = _encode_lengths(frames)
+        size = len(lengths) + sum(frame.nbytes for frame in frames)
+        kind = _INLINE
+        if _RECORD_HEADER.size + size > self.capacity:
+            frames = [memoryview(self._spill(lengths, frames, size))]
+            lengths = b""
+            size = frames[0].nbytes
+            kind = _SPILLED
+
+        record_size = _RECORD_HEADER.size + size
+        while True:
+            with self._lock:
+                head = self._head.value
+                if self.capacity - (head - self._tail.value) >= record_size:
+                    pos = self._write(head, _RECORD_HEADER.pack(size, kind))
+                    pos = self._write(pos, lengths)
+                    for frame in frames:
+                        pos = self._write(pos, frame)
+                    self._head.value = head + record_size
+                    break
+            # the ring is full, give the consumer a chance to catch up
+            time.sleep(0.0001)
+        self.notify()
+
+    def get_nowait(self) -> Optional[list[bytearray]]:
+        tail = self._tail.value
+        if self._head.value == tail:
+            return None
+        size, kind = _RECORD_HEADER.unpack(self._read(tail, _RECORD_HEADER.size))
+        pos = tail + _RECORD_HEADER.size
+        frames = self._unspill(self._read(pos, size)) if kind == _SPILLED else self._read_frames(pos)
+        self._tail.value = tail + _RECORD_HEADER.size + size
+        return frames
+
+    def _read_frames(self, pos: int) -> list[bytearray]:
+        (count,) = _FRAME_COUNT.unpack(self._read(pos, _FRAME_COUNT.size))
+        pos += _FRAME_COUNT.size
+        lengths = struct.unpack(f"<{count}Q", self._read(pos, 8 * count))
+        pos += 8 * count
+        frames = []
+        for length in lengths:
+            frame = bytearray(length)
+            self._read_into(pos, memoryview(frame))
+            frames.append(frame)
+            pos += length
+        return frames
+
+    def empty(self) -> bool:
+        return self._head.value == self._tail.value
+
+    def notify(self) -> None:
+        if self._doorbell is None:
+            return
+        # A full pipe already guarantees a pending wakeup
+        with suppress(BlockingIOError, BrokenPipeError, OSError):
+            os.write(self._doorbell[1].fileno(), b"\0")
+
+    def doorbell_fileno(self) -> int:
+        return self._doorbell[0].fileno()
+
+    def drain_doorbell(self) -> None:
+        with suppress(BlockingIOError, OSError):
+            while os.read(self.doorbell_fileno(), 4096):
+                pass
+
+    def _write(self, pos: int, data) -> int:
+        data = memoryview(data).cast("B")
+        offset = pos % self.capacity
+        first = min(len(data), self.capacity - offset)
+        self._data[offset : offset + first] = data[:first]
+        if first < len(data):
+            self._data[: len(data) - first] = data[first:]
+        return pos + len(data)
+
+    def _read_into(self, pos: int, out: memoryview) -> None:
+        size = len(out)
+        offset = pos % self.capacity
+        first = min(size, self.capacity - offset)
+        out[:first] = self._data[offset : offset + first]
+        if first < size:
+            out[first:] = self._data[: size - first]
+
+    def _read(self, pos: int, size: int) -> bytes:
+        out = bytearray(size)
+        self._read_into(pos, memoryview(out))
+        return bytes(out)
+
+    @staticmethod
+    def _spill(lengths: bytes, frames: list[memoryview], size: int) -> bytes:
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        pos = len(lengths)
+        shm.buf[:pos] = lengths
+        for frame in frames:
+            shm.buf[pos : pos + frame.nbytes] = frame
+            pos += frame.nbytes
+        name = shm.name
+        shm.close()
+        return _SPILL_HEADER.pack(size) + name.encode()
+
+    @staticmethod
+    def _unspill(data: bytes) -> list[bytearray]:
+        (size,) = _SPILL_HEADER.unpack_from(data)
+        shm = shared_memory.SharedMemory(name=data[_SPILL_HEADER.size :].decode())
+        try:
+            buf = shm.buf
+            (count,) = _FRAME_COUNT.unpack_from(buf)
+            lengths = struct.unpack_from(f"<{count}Q", buf, _FRAME_COUNT.size)
+            pos = _FRAME_COUNT.size + 8 * count
+            frames = []
+            for length in lengths:
+                frames.append(bytearray(buf[pos : pos + length]))
+                pos += length
+            del buf
+            return frames
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def close(self) -> None:
+        if self._owner_pid == os.getpid():
+            with suppress(FileNotFoundError):
+                self._shm.unlink()
+
+    def __del__(self):
+        # release the views into the segment so that SharedMemory can unmap it
+        with suppress(Exception):
+            self._data.release()
+            del self._head, self._tail
+
+    def __reduce__(self):
+        return SharedMemoryRing, (self.capacity, self._lock, self._doorbell, self.name)
+
+
+class SharedMemoryQueue:
+    """Multi-producer, multi-consumer queue on top of a :class:`SharedMemoryRing`.
+
+    Used as the request queue between API servers and inference workers. A counting semaphore tracks the number of
+    queued items so that consumers block in the kernel instead of polling, and consumers take turns reading the ring.
+    It implements the subset of the ``queue.Queue`` API used by the loops.
+
+    """
+
+    def __init__(self, ring: SharedMemoryRing, items, get_lock):
+        self._ring = ring
+        self._items = items
+        self._get_lock = get_lock
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        self._ring.put(serialization.dumps(item))
+        self._items.release()
+
+    def put_nowait(self, item: Any) -> None:
+        self.put(item, block=False)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        if not self._items.acquire(block, timeout):
+            raise Empty
+        with self._get_lock:
+            frames = self._ring.get_nowait()
+        return serialization.loads(frames)
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def empty(self) -> bool:
+        return self._ring.empty()
+
+    def close(self) -> None:
+        self._ring.close()
+
+    def __reduce__(self):
+        return SharedMemoryQueue, (self._ring, self._items, self._get_lock)
+
+
+class SharedMemoryTransport(MessageTransport):
+    """Transport that moves responses through one shared memory ring per consumer (API server).
+
+    Unlike :class:`MPQueueTransport`, no manager process is involved: inference workers write straight into the ring
+    and the API server is woken up by the event loop when data is available.
+
+    """
+
+    def __init__(self, rings: list[SharedMemoryRing], codec: Optional[Codec] = None):
+        self._rings = rings
+        self.codec = codec or EnvelopeCodec()
+        self._closed = False
+        self._data_ready: dict[int, tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+
+    def send(self, item: Any, consumer_id: int) -> None:
+        return self._rings[consumer_id].put(self.codec.encode(item))
+
+    def _data_ready_event(self, consumer_id: int) -> asyncio.Event:
+        loop = asyncio.get_running_loop()
+        registered = self._data_ready.get(consumer_id)
+        if registered is not None and registered[0] is loop:
+            return registered[1]
+
+        ring = self._rings[consumer_id]
+        event = asyncio.Event()
+
+        def _on_doorbell():
+            ring.drain_doorbell()
+            event.set()
+
+        loop.add_reader(ring.doorbell_fileno(), _on_doorbell)
+        self._data_ready[consumer_id] = (loop, event)
+        return event
+
+    async def areceive(self, consumer_id: int, timeout: Optional[float] = None, block: bool = True) -> Any:
+        if self._closed:
+            raise asyncio.CancelledError("Transport closed")
+
+        ring = self._rings[consumer_id]
+        data_ready = self._data_ready_event(consumer_id)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (1 if timeout is None else timeout)
+        while True:
+            data_ready.clear()
+            frames = ring.get_nowait()
+            if frames is not None:
+                return self.codec.decode(frames)
+
+            remaining = deadline - loop.time()
+            if remaining > 0:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(data_ready.wait(), remaining)
+            if self._closed:
+                raise asyncio.CancelledError("Transport closed")
+            if loop.time() >= deadline and ring.empty():
+                if timeout is not None:
+                    raise Empty
+                return None
+
+    async def areceive_many(self, consumer_id: int, max_items: int, timeout: Optional[float] = None) -> list:
+        item = await self.areceive(consumer_id, timeout=timeout)
+        if item is None:
+            return []
+        items = [item]
+        ring = self._rings[consumer_id]
+        while len(items) < max_items:
+            frames = ring.get_nowait()
+            if frames is None:
+                break
+            items.append(self.codec.decode(frames))
+        return items
+
+    def close(self, send_sentinel: bool = True) -> None:
+        self._closed = True
+        for ring in self._rings:
+            if send_sentinel:
+                # wake up any consumer waiting on the doorbell so it notices the transport is closed
+                ring.notify()
+            ring.close()
+
+    def __reduce__(self):
+        return SharedMemoryTransport, (self._rings, self.codec)
@@ -14,7 +14,9 @@
 import asyncio
 import logging
 import multiprocessing
+import os
 import pickle
+import struct
 import threading
 import time
 from queue import Empty
@@ -23,10 +25,20 @@ from typing import Any, Optional
 import zmq
 import zmq.asyncio
 
+from litserve.transport import serialization
+from litserve.transport.codec import Codec, PickleCodec
 from litserve.utils import generate_random_zmq_address
 
 logger = logging.getLogger(__name__)
 
+# ZMQ subscriptions are prefix matches, a fixed-width topic makes them exact so that consumer 1 doesn't receive the
+# traffic of consumers 10-19
+_TOPIC = struct.Struct(">I")
+
+
+def encode_topic(consumer_id: int) -> bytes:
+    return _TOPIC.pack(consumer_id)
+
 
 class Broker:
     """Message broker that routes messages between producers and consumers."""
@@ -83,7 +95,8 @@ class Broker:
 class Producer:
     """Producer class for sending messages to consumers."""
 
-    def __init__(self, address: str = None):
+    def __init__(self, address: str = None, codec: Optional[Codec] = None):
+        self._codec = codec or PickleCodec()
         self._context = zmq.Context()
         self._socket = self._context.socket(zmq.PUB)
         self._socket.connect(address)
@@ -102,19 +115,25 @@ class Producer:
         while time.time() - start_time < timeout:
             # Send a ping message to consumer 0 (special system messages)
             try:
-                self._socket.send(b"0|__ping__", zmq.NOBLOCK)
+                self._socket.send(encode_topic(0), zmq.NOBLOCK)
                 time.sleep(0.1)  # Give time for subscription to propagate
                 return True
             except zmq.ZMQError:
                 continue
         return False
 
+    def _get_socket(self, consumer_id: int) -> zmq.Socket:
+        return self._socket
+
     def put(self, item: Any, consumer_id: int) -> None:
-        """Send an item to a specific consumer."""
+        """Send an item to a specific consumer.
+
+        Large buffers (e.g. NumPy arrays) are sent as separate frames without being copied into the pickle stream.
+
+        """
         try:
-            pickled_item = pickle.dumps(item)
-            message = f"{consumer_id}|".encode() + pickled_item
-            self._socket.send(message)
+            frames = self._codec.encode(item)
+            self._get_socket(consumer_id).send_multipart([encode_topic(consumer_id), *frames], copy=False)
         except zmq.ZMQError as e:
             logger.error(f"Error sending item: {e}")
             raise
@@ -130,10 +149,46 @@ class Producer:
             self._context.term()
 
 
+class PushProducer(Producer):
+    """Producer with one PUSH socket per consumer, messages go straight to the consumer without a broker.
+
+    Sockets are connected lazily the first time a consumer is addressed. Unlike PUB, PUSH queues messages until the
+    consumer has bound its socket, so there is no need to wait for subscribers.
+
+    """
+
+    def __init__(self, addresses: list[str], codec: Optional[Codec] = None):
+        self._codec = codec or PickleCodec()
+        self._context = zmq.Context()
+        self._socket = None
+        self._addresses = addresses
+        self._sockets: dict[int, zmq.Socket] = {}
+
+    def wait_for_subscribers(self, timeout: float = 1.0) -> bool:
+        return True
+
+    def _get_socket(self, consumer_id: int) -> zmq.Socket:
+        socket = self._sockets.get(consumer_id)
+        if socket is None:
+            socket = self._context.socket(zmq.PUSH)
+            socket.connect(self._addresses[consumer_id])
+            self._sockets[consumer_id] = socket
+        return socket
+
+    def close(self) -> None:
+        """Clean up resources."""
+        for socket in self._sockets.values():
+            socket.close(linger=0)
+        self._sockets.clear()
+        if self._context:
+            self._context.term()
+
+
 class BaseConsumer:
     """Base class for consumers."""
 
-    def __init__(self, consumer_id: int, address: str):
+    def __init__(self, consumer_id: int, address: str, codec: Optional[Codec] = None):
+        self._codec = codec or PickleCodec()
         self.consumer_id = consumer_id
         self.address = address
         self._context = None
@@ -144,11 +199,13 @@ class BaseConsumer:
         """Setup ZMQ socket - to be implemented by subclasses"""
         raise NotImplementedError
 
-    def _parse_message(self, message: bytes) -> Any:
-        """Parse a message received from ZMQ."""
+    def _parse_message(self, frames: list[zmq.Frame]) -> Any:
+        """Parse a multipart message received from ZMQ."""
+        if len(frames) < 2:
+            # topic-only system message, e.g. the producer ping
+            return None
         try:
-            consumer_id, pickled_data = message.split(b"|", 1)
-            return pickle.loads(pickled_data)
+            return self._codec.decode([frame.buffer for frame in frames[1:]])
         except pickle.PickleError as e:
             logger.error(f"Error deserializing message: {e}")
             raise
@@ -168,25 +225,120 @@ class AsyncConsumer(BaseConsumer):
         self._context = zmq.asyncio.Context()
         self._socket = self._context.socket(zmq.SUB)
         self._socket.connect(self.address)
-        self._socket.setsockopt_string(zmq.SUBSCRIBE, str(self.consumer_id))
+        self._socket.setsockopt(zmq.SUBSCRIBE, encode_topic(self.consumer_id))
 
     async def get(self, timeout: Optional[float] = None) -> Any:
         """Get an item from the queue asynchronously."""
         try:
             if timeout is not None:
-                message = await asyncio.wait_for(self._socket.recv(), timeout)
+                frames = await asyncio.wait_for(self._socket.recv_multipart(copy=False), timeout)
             else:
-                message = await self._socket.recv()
+                frames = await self._socket.recv_multipart(copy=False)
 
-            return self._parse_message(message)
+            return self._parse_message(frames)
         except asyncio.TimeoutError:
             raise Empty
         except zmq.ZMQError:
             raise Empty
 
+    async def get_many(self, max_items: int, timeout: Optional[float] = None) -> list:
+        """Wait for one item, then take whatever else is already queued on the socket, up to ``max_items``."""
+        item = await self.get(timeout=timeout)
+        items = [] if item is None else [item]
+        while len(items) < max_items:
+            try:
+                frames = await self._socket.recv_multipart(zmq.NOBLOCK, copy=False)
+            except zmq.ZMQError:
+                break
+            item = self._parse_message(frames)
+            if item is not None:
+                items.append(item)
+        return items
+
     def close(self) -> None:
         """Clean up resources asynchronously."""
         if self._socket:
             self._socket.close(linger=0)
         if self._context:
             self._context.term()
+
+
+class AsyncPullConsumer(AsyncConsumer):
+    """Async consumer that binds its own PULL socket, producers connect to it directly."""
+
+    def _setup_socket(self):
+        self._context = zmq.asyncio.Context()
+        self._socket = self._context.socket(zmq.PULL)
+        self._socket.bind(self.address)
+
+
+class ZMQRequestQueue:
+    """Request queue built on ZMQ PUSH/PULL sockets.
+
+    Every inference worker binds a PULL socket on its own address and API servers connect a PUSH socket to all of
+    them, so requests are spread round-robin across the workers without a broker. Sockets are created lazily in the
+    process (and thread) that uses them. It implements the subset of the ``queue.Queue`` API used by the loops.
+
+    """
+
+    def __init__(self, addresses: list[str]):
+        self.addresses = addresses
+        self._local = threading.local()
+
+    def _socket(self, socket_type: int) -> zmq.Socket:
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            local.pid = os.getpid()
+            local.context = zmq.Context()
+            local.sockets = {}
+
+        socket = local.sockets.get(socket_type)
+        if socket is None:
+            socket = local.context.socket(socket_type)
+            socket.setsockopt(zmq.LINGER, 0)
+            if socket_type == zmq.PULL:
+                # a queue with a single address belongs to a single worker, whatever its id
+                worker_id = int(os.environ.get("LITSERVE_WORKER_ID", 0)) if len(self.addresses) > 1 else 0
+                socket.bind(self.addresses[worker_id])
+            else:
+                for address in self.addresses:
+                    socket.connect(address)
+            local.sockets[socket_type] = socket
+        return socket
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        try:
+            self._socket(zmq.PUSH).send_multipart(serialization.dumps(item), copy=False)
+        except zmq.ZMQError as e:
+            logger.error(f"Error sending request: {e}")
+            raise
+
+    def put_nowait(self, item: Any) -> None:
+        self.put(item, block=False)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        socket = self._socket(zmq.PULL)
+        if not block:
+            timeout_ms = 0
+        elif timeout is None:
+            timeout_ms = -1
+        else:
+            timeout_ms = int(timeout * 1000)
+        if socket.poll(timeout_ms, zmq.POLLIN) == 0:
+            raise Empty
+        frames = socket.recv_multipart(copy=False)
+        return serialization.loads([frame.buffer for frame in frames])
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def close(self) -> None:
+        local = self._local
+        if getattr(local, "pid", None) == os.getpid():
+            for socket in local.sockets.values():
+                socket.close(linger=0)
+            local.context.term()
+            local.pid = None
+
+    def __reduce__(self):
+        return ZMQRequestQueue, (self.addresses,)
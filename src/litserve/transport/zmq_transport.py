@@ -3,22 +3,47 @@ from typing import Any, Literal, Optional, Union
 import zmq
 
 from litserve.transport.base import MessageTransport
-from litserve.transport.zmq_queue import AsyncConsumer, Producer
+from litserve.transport.codec import Codec, EnvelopeCodec
+from litserve.transport.zmq_queue import AsyncConsumer, AsyncPullConsumer, Producer, PushProducer
 
 
 class ZMQTransport(MessageTransport):
-    def __init__(self, backend_address: str, frontend_address):
+    """Transport over ZeroMQ sockets.
+
+    With ``consumer_addresses``, every consumer (API server) binds a PULL socket on its own address and producers
+    (inference workers) connect to it directly. Otherwise messages go through a PUB/SUB broker listening on
+    ``backend_address`` and ``frontend_address``. Messages are serialized with ``codec``.
+
+    """
+
+    def __init__(
+        self,
+        backend_address: Optional[str] = None,
+        frontend_address: Optional[str] = None,
+        consumer_addresses: Optional[list[str]] = None,
+        codec: Optional[Codec] = None,
+    ):
         self.backend_address = backend_address
         self.frontend_address = frontend_address
+        self.consumer_addresses = consumer_addresses
+        self.codec = codec or EnvelopeCodec()
         self._zmq: Union[Producer, AsyncConsumer, None] = None
 
     def setup(self, operation: Literal[zmq.SUB, zmq.PUB], consumer_id: Optional[int] = None) -> None:
         """Must be called in the subprocess to setup the ZMQ transport."""
         if operation == zmq.PUB:
-            self._zmq = Producer(address=self.backend_address)
+            if self.consumer_addresses is not None:
+                self._zmq = PushProducer(self.consumer_addresses, codec=self.codec)
+            else:
+                self._zmq = Producer(address=self.backend_address, codec=self.codec)
             self._zmq.wait_for_subscribers()
         elif operation == zmq.SUB:
-            self._zmq = AsyncConsumer(consumer_id=consumer_id, address=self.frontend_address)
+            if self.consumer_addresses is not None:
+                self._zmq = AsyncPullConsumer(
+                    consumer_id=consumer_id, address=self.consumer_addresses[consumer_id], codec=self.codec
+                )
+            else:
+                self._zmq = AsyncConsumer(consumer_id=consumer_id, address=self.frontend_address, codec=self.codec)
         else:
             raise ValueError(f"Invalid operation {operation}")
 
@@ -32,11 +57,16 @@ class ZMQTransport(MessageTransport):
             self.setup(zmq.SUB, consumer_id)
         return await self._zmq.get(timeout=timeout)
 
+    async def areceive_many(self, consumer_id: int, max_items: int, timeout: Optional[float] = None) -> list:
+        if self._zmq is None:
+            self.setup(zmq.SUB, consumer_id)
+        return await self._zmq.get_many(max_items, timeout=timeout)
+
     def close(self, **kwargs) -> None:
+        # The main process only hands the transport to its workers and API servers, it has nothing to close
         if self._zmq:
             self._zmq.close()
-        else:
-            raise ValueError("ZMQ not initialized, make sure ZMQTransport.setup() is called.")
+            self._zmq = None
 
     def __reduce__(self):
-        return ZMQTransport, (self.backend_address, self.frontend_address)
+        return ZMQTransport, (self.backend_address, self.frontend_address, self.consumer_addresses, self.codec)
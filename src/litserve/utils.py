@@ -29,6 +29,7 @@ from collections import deque
 from collections.abc import AsyncIterator
 from contextlib import contextmanager
 from enum import Enum
+from multiprocessing.managers import BaseProxy
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, TextIO, Union
 
@@ -77,6 +78,24 @@ def dump_exception(exception):
     return pickle.dumps(exception)
 
 
+async def put_request(request_queue, item: Any) -> None:
+    """Put a request on the request queue without blocking the event loop.
+
+    Manager queues are a synchronous round trip to the manager process, so they are offloaded to a thread. The other
+    request queue backends enqueue without blocking. With a ``RequestDispatcher`` the request goes to the queue of the
+    worker it is assigned to.
+
+    """
+    from litserve.transport.dispatcher import RequestDispatcher
+
+    if isinstance(request_queue, RequestDispatcher):
+        request_queue = request_queue.select(item)
+    if isinstance(request_queue, BaseProxy):
+        await asyncio.to_thread(request_queue.put, item)
+    else:
+        request_queue.put(item)
+
+
 async def azip(*async_iterables):
     iterators = [ait.__aiter__() for ait in async_iterables]
     while True:
@@ -124,6 +143,7 @@ def wrap_litserve_start(server: "LitServer", worker_monitor: bool = False):
         for p in server.inference_workers:
             p.terminate()
             p.join()
+        server._close_request_queues()
         server.manager.shutdown()
 
 
@@ -13,7 +13,7 @@
 # limitations under the License.
 import asyncio
 import time
-from queue import Queue
+from queue import Empty, Queue
 from unittest.mock import ANY, MagicMock
 
 import pytest
@@ -25,6 +25,7 @@ from httpx import ASGITransport, AsyncClient
 
 import litserve as ls
 from litserve import LitAPI, LitServer
+from litserve.batching import AdaptiveBatchTimeout
 from litserve.callbacks import CallbackRunner
 from litserve.loops.base import _SENTINEL_VALUE, _StopLoopError, collate_requests
 from litserve.loops.simple_loops import BatchedLoop
@@ -106,6 +107,22 @@ async def test_batched():
     assert response2.json() == {"output": 11.0}
 
 
+@pytest.mark.asyncio
+async def test_batched_adaptive_timeout():
+    # batches of any size are fine, the window depends on the traffic
+    api = SimpleBatchedAPI(max_batch_size=4, batch_timeout="auto", latency_slo=0.5)
+    server = LitServer(api, accelerator="cpu", devices=1, timeout=10)
+
+    with wrap_litserve_start(server) as server:
+        async with (
+            LifespanManager(server.app) as manager,
+            AsyncClient(transport=ASGITransport(app=manager.app), base_url="http://test") as ac,
+        ):
+            responses = await asyncio.gather(*[ac.post("/predict", json={"input": float(i)}) for i in range(6)])
+
+    assert [response.json() for response in responses] == [{"output": float(i) ** 2} for i in range(6)]
+
+
 @pytest.mark.asyncio
 async def test_unbatched():
     api = SimpleTorchAPI(max_batch_size=1)
@@ -271,6 +288,105 @@ def test_collate_requests_sentinel():
         collate_requests(MagicMock(), api, request_queue, MagicMock())
 
 
+def test_collate_requests_blocks_without_polling(monkeypatch):
+    monkeypatch.setattr("litserve.loops.base._IDLE_TIMEOUT", 0.2)
+    api = ls.test_examples.SimpleBatchedAPI(max_batch_size=4, batch_timeout=0)
+    api.request_timeout = 5
+    request_queue = MagicMock(wraps=Queue())
+
+    # an idle worker makes a single blocking call and comes back with an empty batch
+    payloads, timed_out_uids = collate_requests(MagicMock(), api, request_queue, MagicMock())
+    assert payloads == []
+    assert timed_out_uids == []
+    request_queue.get.assert_called_once_with(timeout=0.2)
+    request_queue.get_nowait.assert_not_called()
+
+
+def test_collate_requests_waits_for_batch_after_first_request():
+    api = ls.test_examples.SimpleBatchedAPI(max_batch_size=4, batch_timeout=0.5)
+    api.request_timeout = 5
+    request_queue = MagicMock()
+    request_queue.get.side_effect = [(0, "uuid-0", time.monotonic(), 0), Empty()]
+    request_queue.get_nowait.side_effect = [(0, "uuid-1", time.monotonic(), 1), Empty()]
+
+    payloads, _ = collate_requests(MagicMock(), api, request_queue, MagicMock())
+    assert [uid for _, uid, _ in payloads] == ["uuid-0", "uuid-1"]
+    # the queued request is taken right away, then the worker blocks for the rest of the window
+    assert request_queue.get.call_count == 2
+    remaining = request_queue.get.call_args.kwargs["timeout"]
+    assert 0.4 < remaining <= 0.5
+
+
+def test_adaptive_batch_timeout_validation():
+    with pytest.raises(ValueError, match="latency_slo is required"):
+        SimpleBatchLitAPI(max_batch_size=4, batch_timeout="auto")
+    with pytest.raises(ValueError, match="must be a number or 'auto'"):
+        SimpleBatchLitAPI(max_batch_size=4, batch_timeout="fast")
+    with pytest.raises(ValueError, match="latency_slo must be greater than 0"):
+        SimpleBatchLitAPI(max_batch_size=4, batch_timeout="auto", latency_slo=0)
+
+    api = SimpleBatchLitAPI(max_batch_size=4, batch_timeout="auto", latency_slo=0.5)
+    assert isinstance(api._adaptive_batch_timeout, AdaptiveBatchTimeout)
+    # the SLO bounds the wait, so a short request timeout is fine
+    LitServer(api, timeout=0.1)
+
+
+def test_adaptive_batch_timeout_wait_time():
+    controller = AdaptiveBatchTimeout(latency_slo=1.0)
+    # nothing is known about the traffic yet
+    assert controller.wait_time(oldest_timestamp=0.0, batch_size=1, max_batch_size=8, now=0.0) == 0
+
+    # low traffic, one request every 10s: the next one won't come within the SLO
+    controller.observe_arrival(0.0)
+    controller.observe_arrival(10.0)
+    assert controller.wait_time(oldest_timestamp=10.0, batch_size=1, max_batch_size=8, now=10.0) == 0
+
+    # high traffic, one request every 10ms: wait until the batch is full
+    controller = AdaptiveBatchTimeout(latency_slo=1.0)
+    for i in range(10):
+        controller.observe_arrival(i * 0.01)
+    assert controller.wait_time(oldest_timestamp=0.1, batch_size=1, max_batch_size=8, now=0.1) == pytest.approx(0.07)
+    assert controller.wait_time(oldest_timestamp=0.1, batch_size=8, max_batch_size=8, now=0.1) == 0
+
+    # processing the full batch takes 0.995s, which leaves no time to wait within the SLO
+    controller.observe_batch(8, 0.995)
+    assert controller.wait_time(oldest_timestamp=0.1, batch_size=1, max_batch_size=8, now=0.1) == 0
+
+
+def test_adaptive_batch_timeout_predict_duration():
+    controller = AdaptiveBatchTimeout(latency_slo=1.0, alpha=0.5)
+    assert controller.predict_duration(4) == 0
+    controller.observe_batch(2, 0.2)
+    assert controller.predict_duration(4) == pytest.approx(0.4)
+    assert controller.predict_duration(1) == pytest.approx(0.2)
+    controller.observe_batch(6, 0.4)
+    assert controller.predict_duration(4) == pytest.approx(0.3)
+    controller.observe_batch(2, 0.4)
+    assert controller.predict_duration(2) == pytest.approx(0.3)
+
+
+def test_collate_requests_adaptive_timeout():
+    api = SimpleBatchLitAPI(max_batch_size=8, batch_timeout="auto", latency_slo=1.0)
+    api.request_timeout = 5
+
+    # a single request with no history is sent right away instead of waiting for a batch
+    request_queue = Queue()
+    request_queue.put((0, "uuid-0", time.monotonic(), 0))
+    start = time.monotonic()
+    payloads, _ = collate_requests(MagicMock(), api, request_queue, MagicMock())
+    assert len(payloads) == 1
+    assert time.monotonic() - start < 0.5
+
+    # with requests coming in every 10ms, the controller waits for the batch to fill
+    now = time.monotonic()
+    for i in range(10):
+        api._adaptive_batch_timeout.observe_arrival(now - 0.2 + i * 0.01)
+    for i in range(8):
+        request_queue.put((0, f"uuid-{i}", now + i * 0.01, i))
+    payloads, _ = collate_requests(MagicMock(), api, request_queue, MagicMock())
+    assert len(payloads) == 8
+
+
 class BatchSizeMismatchAPI(SimpleBatchLitAPI):
     def predict(self, x):
         assert len(x) == 2, "Expected two concurrent inputs to be batched"
@@ -65,7 +65,7 @@ def test_device_identifiers_error(simple_litapi, devices):
         LitServer(simple_litapi, accelerator="cuda", devices=devices, timeout=10)
 
 
-@pytest.mark.parametrize("use_zmq", [True, False])
+@pytest.mark.parametrize("use_zmq", [True, False, "shm"])
 @pytest.mark.asyncio
 async def test_stream(simple_stream_api, use_zmq):
     simple_stream_api.stream = True
@@ -94,7 +94,7 @@ async def test_stream(simple_stream_api, use_zmq):
             )
 
 
-@pytest.mark.parametrize("use_zmq", [True, False])
+@pytest.mark.parametrize("use_zmq", [True, False, "shm"])
 @pytest.mark.asyncio
 async def test_batched_stream_server(simple_batched_stream_api, use_zmq):
     api = simple_batched_stream_api
@@ -123,6 +123,34 @@ async def test_batched_stream_server(simple_batched_stream_api, use_zmq):
             )
 
 
+@pytest.mark.parametrize("fast_queue", [False, True, "shm"])
+@pytest.mark.parametrize("request_dispatch", ["least_loaded", "power_of_two"])
+@pytest.mark.asyncio
+async def test_request_dispatch(simple_litapi, fast_queue, request_dispatch):
+    server = LitServer(
+        simple_litapi,
+        accelerator="cpu",
+        devices=1,
+        workers_per_device=2,
+        timeout=10,
+        fast_queue=fast_queue,
+        request_dispatch=request_dispatch,
+    )
+    with wrap_litserve_start(server) as server:
+        async with (
+            LifespanManager(server.app) as manager,
+            AsyncClient(transport=ASGITransport(app=manager.app), base_url="http://test") as ac,
+        ):
+            responses = await asyncio.gather(*[ac.post("/predict", json={"input": i}, timeout=10) for i in range(8)])
+            assert [response.json() for response in responses] == [{"output": i**2} for i in range(8)]
+            assert server.litapi_request_queues["/predict"].in_flight == [0, 0]
+
+
+def test_invalid_request_dispatch(simple_litapi):
+    with pytest.raises(ValueError, match="request_dispatch must be"):
+        LitServer(simple_litapi, request_dispatch="random")
+
+
 def test_litapi_with_stream(simple_litapi_cls):
     with pytest.raises(
         ValueError,
@@ -1021,3 +1049,8 @@ def test_health_check_no_stale_cache(lifespan_mock, simple_litapi):
         server.workers_setup_status = {"worker-0": WorkerSetupStatus.READY}
         response = client.get("/health")
         assert response.status_code == 200, "Should recover when workers become ready again"
+
+
+def test_invalid_fast_queue(simple_litapi):
+    with pytest.raises(ValueError, match="fast_queue must be a boolean, 'zmq' or 'shm'"):
+        LitServer(simple_litapi, fast_queue="redis")
@@ -1,12 +1,24 @@
 import asyncio
 import multiprocessing as mp
+import multiprocessing.queues
+import pickle
+import uuid
 from queue import Empty
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
-from litserve.transport.factory import TransportConfig, create_transport_from_config
+from litserve.transport import serialization
+from litserve.transport.base import MessageTransport
+from litserve.transport.codec import CODECS, EnvelopeCodec
+from litserve.transport.dispatcher import RequestDispatcher
+from litserve.transport.factory import TransportConfig, create_request_queue_from_config, create_transport_from_config
 from litserve.transport.process_transport import MPQueueTransport
+from litserve.transport.shm_transport import SharedMemoryQueue, SharedMemoryRing, SharedMemoryTransport
+from litserve.transport.zmq_queue import ZMQRequestQueue
+from litserve.transport.zmq_transport import ZMQTransport
+from litserve.utils import LitAPIStatus, LoopResponseType, put_request
 
 
 class TestMPQueueTransport:
@@ -86,6 +98,16 @@ class TestMPQueueTransport:
         for queue in queues:
             assert queue.get() is None
 
+    @pytest.mark.asyncio
+    async def test_areceive_many(self, transport, queues):
+        for i in range(5):
+            queues[0].put(("uid", i))
+
+        assert await transport.areceive_many(0, max_items=3) == [("uid", 0), ("uid", 1), ("uid", 2)]
+        assert await transport.areceive_many(0, max_items=3) == [("uid", 3), ("uid", 4)]
+        with pytest.raises(Empty):
+            await transport.areceive_many(0, max_items=3, timeout=0.1)
+
     def test_reduce(self, transport, queues):
         cls, args = transport.__reduce__()
 
@@ -93,6 +115,418 @@ class TestMPQueueTransport:
         assert args == (None, queues)
 
 
+class _ListTransport(MessageTransport):
+    def __init__(self, items):
+        self.items = items
+
+    def send(self, item, consumer_id):
+        self.items.append(item)
+
+    async def areceive(self, consumer_id=None, timeout=None):
+        return self.items.pop(0) if self.items else None
+
+
+@pytest.mark.asyncio
+async def test_default_areceive_many():
+    transport = _ListTransport([("uid", 0), ("uid", 1)])
+    assert await transport.areceive_many(0, max_items=10) == [("uid", 0)]
+    assert await transport.areceive_many(0, max_items=10) == [("uid", 1)]
+    assert await transport.areceive_many(0, max_items=10) == []
+
+
+class TestMPQueueTransportNativeQueues:
+    @pytest.fixture
+    def transport(self):
+        config = TransportConfig(transport_type="mp", response_queue_type="mp", num_consumers=2)
+        transport = create_transport_from_config(config)
+        yield transport
+        transport.close()
+
+    def test_factory(self, transport):
+        assert all(isinstance(queue, mp.queues.Queue) for queue in transport._queues)
+
+    @pytest.mark.asyncio
+    async def test_areceive_drains_available_messages(self, transport):
+        for i in range(3):
+            transport.send(("uid", i), consumer_id=1)
+        await asyncio.sleep(0.1)
+
+        assert await transport.areceive(1) == ("uid", 0)
+        assert list(transport._pending[1]) == [("uid", 1), ("uid", 2)]
+        assert await transport.areceive(1) == ("uid", 1)
+        assert await transport.areceive(1) == ("uid", 2)
+
+    @pytest.mark.asyncio
+    async def test_areceive_many(self, transport):
+        for i in range(5):
+            transport.send(("uid", i), consumer_id=0)
+        await asyncio.sleep(0.1)
+
+        assert await transport.areceive_many(0, max_items=3) == [("uid", 0), ("uid", 1), ("uid", 2)]
+        assert await transport.areceive_many(0, max_items=3) == [("uid", 3), ("uid", 4)]
+
+    @pytest.mark.asyncio
+    async def test_receive_wakes_up_on_send(self, transport):
+        task = asyncio.create_task(transport.areceive(0))
+        await asyncio.sleep(0.05)
+        assert not task.done()
+
+        ctx = mp.get_context("spawn")
+        process = ctx.Process(target=transport.send, args=(("uid", "from worker"), 0))
+        process.start()
+        assert await asyncio.wait_for(task, 5) == ("uid", "from worker")
+        process.join()
+
+    @pytest.mark.asyncio
+    async def test_areceive_timeout(self, transport):
+        with pytest.raises(Empty):
+            await transport.areceive(0, timeout=0.1)
+
+    @pytest.mark.asyncio
+    async def test_close_wakes_up_receiver(self, transport):
+        task = asyncio.create_task(transport.areceive(0))
+        await asyncio.sleep(0.05)
+        transport.close()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, 5)
+
+
+class TestSharedMemoryTransport:
+    @pytest.fixture
+    def transport(self):
+        config = TransportConfig(transport_type="shm", num_consumers=2, shm_buffer_size=1024)
+        transport = create_transport_from_config(config)
+        yield transport
+        transport.close()
+
+    def test_factory(self, transport):
+        assert isinstance(transport, SharedMemoryTransport)
+        assert len(transport._rings) == 2
+        assert all(isinstance(ring, SharedMemoryRing) for ring in transport._rings)
+
+    @pytest.mark.asyncio
+    async def test_send_receive(self, transport):
+        transport.send(("uid-1", {"test": "data"}), consumer_id=0)
+        transport.send(("uid-2", {"test": "other"}), consumer_id=1)
+
+        assert await transport.areceive(0) == ("uid-1", {"test": "data"})
+        assert await transport.areceive(1) == ("uid-2", {"test": "other"})
+
+    @pytest.mark.asyncio
+    async def test_wraparound(self, transport):
+        for i in range(100):
+            item = ("uid", "x" * (i % 50))
+            transport.send(item, consumer_id=0)
+            assert await transport.areceive(0) == item
+
+    @pytest.mark.asyncio
+    async def test_large_message_is_spilled(self, transport):
+        item = ("uid", b"x" * 10_000)
+        transport.send(item, consumer_id=0)
+        assert await transport.areceive(0) == item
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [4_096, 100_000])
+    async def test_numpy_payload(self, size):
+        # the first array fits in the ring, the second one is spilled
+        config = TransportConfig(transport_type="shm", num_consumers=1, shm_buffer_size=64 * 1024)
+        transport = create_transport_from_config(config)
+        array = np.random.rand(size)
+        transport.send(("uid", array), consumer_id=0)
+        uid, received = await transport.areceive(0)
+        transport.close()
+        assert uid == "uid"
+        np.testing.assert_array_equal(received, array)
+
+    @pytest.mark.asyncio
+    async def test_areceive_many(self, transport):
+        for i in range(5):
+            transport.send(("uid", i), consumer_id=0)
+
+        assert await transport.areceive_many(0, max_items=3) == [("uid", 0), ("uid", 1), ("uid", 2)]
+        assert await transport.areceive_many(0, max_items=3) == [("uid", 3), ("uid", 4)]
+        assert await transport.areceive_many(0, max_items=3, timeout=None) == []
+
+    @pytest.mark.asyncio
+    async def test_receive_wakes_up_on_send(self, transport):
+        task = asyncio.create_task(transport.areceive(0, timeout=5))
+        await asyncio.sleep(0.05)
+        assert not task.done()
+
+        await asyncio.to_thread(transport.send, ("uid", 1), 0)
+        assert await asyncio.wait_for(task, 1) == ("uid", 1)
+
+    @pytest.mark.asyncio
+    async def test_areceive_timeout(self, transport):
+        with pytest.raises(Empty):
+            await transport.areceive(0, timeout=0.1)
+
+    @pytest.mark.asyncio
+    async def test_areceive_when_closed(self, transport):
+        transport.close()
+        with pytest.raises(asyncio.CancelledError, match="Transport closed"):
+            await transport.areceive(0)
+
+    @pytest.mark.asyncio
+    async def test_send_from_another_process(self, transport):
+        ctx = mp.get_context("spawn")
+        process = ctx.Process(target=transport.send, args=(("uid", "from worker"), 1))
+        process.start()
+        process.join()
+        assert await transport.areceive(1, timeout=5) == ("uid", "from worker")
+
+
+class TestZMQTransport:
+    @pytest.fixture
+    def transport(self):
+        config = TransportConfig(transport_type="zmq", num_consumers=2)
+        transport = create_transport_from_config(config)
+        yield transport
+        transport.close()
+
+    def test_factory_direct_topology(self, transport):
+        assert isinstance(transport, ZMQTransport)
+        assert len(transport.consumer_addresses) == 2
+        assert transport.backend_address is None
+
+    @pytest.mark.asyncio
+    async def test_send_receive(self, transport):
+        # the API server binds its PULL socket on first receive
+        with pytest.raises(Empty):
+            await transport.areceive(consumer_id=1, timeout=0.1)
+
+        producer = pickle.loads(pickle.dumps(transport))
+        try:
+            array = np.arange(100_000)
+            producer.send(("uid", array), consumer_id=1)
+            uid, received = await transport.areceive(consumer_id=1, timeout=5)
+        finally:
+            producer.close()
+        assert uid == "uid"
+        np.testing.assert_array_equal(received, array)
+
+    @pytest.mark.asyncio
+    async def test_send_before_consumer_binds(self, transport):
+        producer = pickle.loads(pickle.dumps(transport))
+        try:
+            producer.send(("uid", 1), consumer_id=0)
+            assert await transport.areceive(consumer_id=0, timeout=5) == ("uid", 1)
+        finally:
+            producer.close()
+
+    @pytest.mark.asyncio
+    async def test_areceive_many(self, transport):
+        with pytest.raises(Empty):
+            await transport.areceive_many(0, max_items=3, timeout=0.1)
+
+        producer = pickle.loads(pickle.dumps(transport))
+        try:
+            for i in range(5):
+                producer.send(("uid", i), consumer_id=0)
+            await asyncio.sleep(0.1)
+            assert await transport.areceive_many(0, max_items=3, timeout=5) == [("uid", 0), ("uid", 1), ("uid", 2)]
+            assert await transport.areceive_many(0, max_items=3, timeout=5) == [("uid", 3), ("uid", 4)]
+        finally:
+            producer.close()
+
+    def test_close_without_setup(self, transport):
+        transport.close()
+
+
+class TestCodecs:
+    @pytest.mark.parametrize(
+        "uid",
+        [str(uuid.uuid4()), uuid.uuid4(), "custom-uid", str(uuid.uuid4()).upper()],
+        ids=["str", "uuid", "other", "upper"],
+    )
+    @pytest.mark.parametrize("data", ['{"output": 1}', b"\x00\x01", None, "", "héllo"])
+    @pytest.mark.parametrize("status", [LitAPIStatus.OK, LitAPIStatus.ERROR, LitAPIStatus.FINISH_STREAMING])
+    def test_envelope_round_trip(self, uid, data, status):
+        codec = EnvelopeCodec()
+        item = (uid, (data, status, LoopResponseType.STREAMING, 3))
+        frames = codec.encode(item)
+        assert frames[0][0] == 0x4C
+        decoded = codec.decode(frames)
+        assert decoded == item
+        assert type(decoded[0]) is type(uid)
+
+    def test_envelope_is_compact(self):
+        item = (str(uuid.uuid4()), ("token", LitAPIStatus.OK, LoopResponseType.STREAMING, 0))
+        header, payload = EnvelopeCodec().encode(item)
+        assert len(header) == 25
+        assert payload == b"token"
+        assert len(header) + len(payload) < len(pickle.dumps(item))
+
+    @pytest.mark.parametrize(
+        "item",
+        [
+            ("uid", ({"output": 1}, LitAPIStatus.OK, LoopResponseType.REGULAR, 0)),
+            ("uid", ("text", "UNKNOWN", LoopResponseType.REGULAR, 0)),
+            ("uid", ("text", LitAPIStatus.OK, LoopResponseType.REGULAR, None)),
+            None,
+            {"test": "data"},
+        ],
+    )
+    def test_envelope_falls_back_to_pickle(self, item):
+        codec = EnvelopeCodec()
+        frames = codec.encode(item)
+        assert frames[0][0] == pickle.PROTO[0]
+        assert codec.decode(frames) == item
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("codec", ["envelope", "pickle"])
+    async def test_transport_codec(self, codec):
+        config = TransportConfig(transport_type="shm", num_consumers=1, codec=codec)
+        transport = create_transport_from_config(config)
+        assert isinstance(transport.codec, CODECS[codec])
+        item = (str(uuid.uuid4()), ("token", LitAPIStatus.OK, LoopResponseType.STREAMING, 0))
+        transport.send(item, consumer_id=0)
+        assert await transport.areceive(0) == item
+        transport.close()
+
+
+class TestSerialization:
+    def test_small_objects_stay_in_band(self):
+        frames = serialization.dumps({"array": np.zeros(8), "text": "hello"})
+        assert len(frames) == 1
+
+    def test_large_buffers_are_out_of_band(self):
+        array = np.arange(1_000_000, dtype=np.int64)
+        frames = serialization.dumps(("uid", array, array[:10]))
+        assert len(frames) == 2
+        assert frames[1].nbytes == array.nbytes
+        assert len(frames[0]) < 1024
+
+        uid, received, head = serialization.loads(frames)
+        assert uid == "uid"
+        np.testing.assert_array_equal(received, array)
+        np.testing.assert_array_equal(head, array[:10])
+
+    def test_non_contiguous_array(self):
+        array = np.arange(1_000_000, dtype=np.int64)[::2]
+        np.testing.assert_array_equal(serialization.loads(serialization.dumps(array)), array)
+
+
+def _get_from_queue(request_queue, result_queue):
+    result_queue.put(request_queue.get(timeout=5))
+
+
+class TestRequestQueues:
+    @pytest.fixture
+    def manager(self):
+        manager = mp.Manager()
+        yield manager
+        manager.shutdown()
+
+    @pytest.mark.parametrize(
+        ("request_queue_type", "expected_type"),
+        [("mp", mp.queues.Queue), ("shm", SharedMemoryQueue), ("zmq", ZMQRequestQueue)],
+    )
+    def test_create_request_queue(self, request_queue_type, expected_type):
+        config = TransportConfig(request_queue_type=request_queue_type)
+        request_queue = create_request_queue_from_config(config, num_workers=2)
+        try:
+            assert isinstance(request_queue, expected_type)
+        finally:
+            request_queue.close()
+
+    def test_create_manager_request_queue(self, manager):
+        config = TransportConfig(request_queue_type="manager")
+        config.manager = manager
+        request_queue = create_request_queue_from_config(config)
+        request_queue.put("item")
+        assert request_queue.get(timeout=1) == "item"
+
+    @pytest.mark.parametrize("request_queue_type", ["mp", "shm", "zmq"])
+    def test_put_get(self, request_queue_type):
+        config = TransportConfig(request_queue_type=request_queue_type)
+        request_queue = create_request_queue_from_config(config)
+        try:
+            with pytest.raises(Empty):
+                request_queue.get(timeout=0.01)
+            items = [(0, f"uid-{i}", float(i), {"input": "x" * i * 100}) for i in range(10)]
+            for item in items:
+                request_queue.put(item)
+            assert [request_queue.get(timeout=1) for _ in items] == items
+            with pytest.raises(Empty):
+                request_queue.get_nowait()
+        finally:
+            request_queue.close()
+
+    @pytest.mark.parametrize("request_queue_type", ["mp", "shm", "zmq"])
+    def test_get_from_worker_process(self, request_queue_type):
+        config = TransportConfig(request_queue_type=request_queue_type)
+        request_queue = create_request_queue_from_config(config)
+        ctx = mp.get_context("spawn")
+        result_queue = ctx.Queue()
+        process = ctx.Process(target=_get_from_queue, args=(request_queue, result_queue))
+        process.start()
+        try:
+            request_queue.put((0, "uid", 1.0, {"input": 4.0}))
+            assert result_queue.get(timeout=10) == (0, "uid", 1.0, {"input": 4.0})
+        finally:
+            process.join()
+            request_queue.close()
+
+
+def _request(uid):
+    return (0, uid, 0.0, {"input": 4.0})
+
+
+class TestRequestDispatcher:
+    def test_least_loaded(self):
+        queues = [MagicMock() for _ in range(3)]
+        dispatcher = RequestDispatcher(queues, "least_loaded")
+        for i in range(3):
+            dispatcher.put(_request(f"uid-{i}"))
+        assert dispatcher.in_flight == [1, 1, 1]
+        assert [queue.put.call_count for queue in queues] == [1, 1, 1]
+
+        dispatcher.complete("uid-1")
+        dispatcher.complete("unknown")
+        assert dispatcher.in_flight == [1, 0, 1]
+        assert dispatcher.select(_request("uid-3")) is queues[1]
+        assert dispatcher.in_flight == [1, 1, 1]
+
+    def test_power_of_two(self):
+        queues = [MagicMock() for _ in range(2)]
+        dispatcher = RequestDispatcher(queues, "power_of_two")
+        dispatcher.select(_request("uid-0"))
+        # with two workers both are always compared, so the idle one wins
+        for i in range(1, 10):
+            dispatcher.select(_request(f"uid-{i}"))
+            assert max(dispatcher.in_flight) - min(dispatcher.in_flight) <= 1
+        for i in range(10):
+            dispatcher.complete(f"uid-{i}")
+        assert dispatcher.in_flight == [0, 0]
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError, match="Invalid dispatch policy"):
+            RequestDispatcher([MagicMock()], "random")
+
+    @pytest.mark.parametrize("request_queue_type", ["mp", "shm", "zmq"])
+    def test_create_from_config(self, request_queue_type):
+        config = TransportConfig(request_queue_type=request_queue_type, request_dispatch="least_loaded")
+        dispatcher = create_request_queue_from_config(config, num_workers=2)
+        try:
+            assert isinstance(dispatcher, RequestDispatcher)
+            assert len(dispatcher.queues) == 2
+            asyncio.run(put_request(dispatcher, _request("uid-0")))
+            asyncio.run(put_request(dispatcher, _request("uid-1")))
+            assert dispatcher.worker_queue(0).get(timeout=1) == _request("uid-0")
+            assert dispatcher.worker_queue(1).get(timeout=1) == _request("uid-1")
+        finally:
+            dispatcher.close()
+
+    def test_pickle_resets_counts(self):
+        dispatcher = RequestDispatcher([[], []], "power_of_two")
+        dispatcher.select(_request("uid-0"))
+        restored = pickle.loads(pickle.dumps(dispatcher))
+        assert restored.policy == "power_of_two"
+        assert restored.queues == [[], []]
+        assert restored.in_flight == [0, 0]
+
+
 class TestTransportFactory:
     @pytest.fixture
     def mock_manager(self):
@@ -3,10 +3,18 @@ import pickle
 from queue import Empty
 from unittest.mock import AsyncMock, Mock, patch
 
+import numpy as np
 import pytest
 import zmq
 
-from litserve.transport.zmq_queue import AsyncConsumer, Broker, Producer
+from litserve.transport.zmq_queue import (
+    AsyncConsumer,
+    AsyncPullConsumer,
+    Broker,
+    Producer,
+    PushProducer,
+    encode_topic,
+)
 
 
 @pytest.fixture
@@ -56,26 +64,41 @@ def test_producer_send(mock_context):
 
     # Test sending simple data
     producer.put("test_data", consumer_id=1)
-    sent_message = socket.send.call_args[0][0]
-    consumer_id, data = sent_message.split(b"|", 1)
-    assert consumer_id == b"1"
+    topic, data = socket.send_multipart.call_args[0][0]
+    assert topic == encode_topic(1)
     assert pickle.loads(data) == "test_data"
 
     # Test sending complex data
     complex_data = {"key": [1, 2, 3]}
     producer.put(complex_data, consumer_id=2)
-    sent_message = socket.send.call_args[0][0]
-    consumer_id, data = sent_message.split(b"|", 1)
-    assert consumer_id == b"2"
+    topic, data = socket.send_multipart.call_args[0][0]
+    assert topic == encode_topic(2)
     assert pickle.loads(data) == complex_data
 
 
+def test_producer_sends_large_buffers_out_of_band(mock_context):
+    _, socket = mock_context
+    producer = Producer(address="test_addr")
+
+    array = np.arange(1024 * 1024, dtype=np.float32)
+    producer.put(("uid", array), consumer_id=1)
+    ((topic, *frames),), kwargs = socket.send_multipart.call_args
+    assert kwargs == {"copy": False}
+    assert topic == encode_topic(1)
+    assert len(frames) == 2
+    assert frames[1].nbytes == array.nbytes
+
+    uid, received = pickle.loads(frames[0], buffers=frames[1:])
+    assert uid == "uid"
+    np.testing.assert_array_equal(received, array)
+
+
 def test_producer_error_handling(mock_context):
     _, socket = mock_context
     producer = Producer(address="test_addr")
 
     # Test ZMQ error
-    socket.send.side_effect = zmq.ZMQError("Test error")
+    socket.send_multipart.side_effect = zmq.ZMQError("Test error")
     with pytest.raises(zmq.ZMQError):
         producer.put("data", consumer_id=1)
 
@@ -109,15 +132,15 @@ async def test_async_consumer(mock_async_context, timeout):
 
     # Setup mock received data
     test_data = {"test": "data"}
-    message = b"1|" + pickle.dumps(test_data)
-    socket.recv.return_value = message
+    frames = [Mock(buffer=memoryview(encode_topic(1))), Mock(buffer=memoryview(pickle.dumps(test_data)))]
+    socket.recv_multipart.return_value = frames
 
     # Test receiving
     received = await consumer.get(timeout=timeout)
     assert received == test_data
 
     # Test timeout
-    socket.recv.side_effect = asyncio.TimeoutError()
+    socket.recv_multipart.side_effect = asyncio.TimeoutError()
     with pytest.raises(Empty):
         await consumer.get(timeout=timeout)
 
@@ -145,3 +168,36 @@ def test_producer_cleanup():
 
         assert socket.close.called
         assert mock_ctx.return_value.term.called
+
+
+def test_consumer_subscribes_to_exact_topic(mock_async_context):
+    _, socket = mock_async_context
+    AsyncConsumer(consumer_id=1, address="test_addr")
+    socket.setsockopt.assert_called_once_with(zmq.SUBSCRIBE, encode_topic(1))
+    # fixed width topics can't be a prefix of each other
+    assert not encode_topic(10).startswith(encode_topic(1))
+    assert len(encode_topic(1)) == len(encode_topic(2**31))
+
+
+def test_push_producer_connects_to_each_consumer(mock_context):
+    mock_ctx, socket = mock_context
+    producer = PushProducer(["addr-0", "addr-1"])
+    assert producer.wait_for_subscribers()
+
+    producer.put("a", consumer_id=1)
+    producer.put("b", consumer_id=1)
+    producer.put("c", consumer_id=0)
+    mock_ctx.return_value.socket.assert_called_with(zmq.PUSH)
+    assert mock_ctx.return_value.socket.call_count == 2
+    assert [call.args[0] for call in socket.connect.call_args_list] == ["addr-1", "addr-0"]
+
+    producer.close()
+    assert socket.close.call_count == 2
+    assert mock_ctx.return_value.term.called
+
+
+def test_pull_consumer_binds(mock_async_context):
+    mock_ctx, socket = mock_async_context
+    AsyncPullConsumer(consumer_id=1, address="addr-1")
+    mock_ctx.return_value.socket.assert_called_once_with(zmq.PULL)
+    socket.bind.assert_called_once_with("addr-1")